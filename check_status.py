@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 """Check the status of all pipeline phases."""
 
-from pathlib import Path
-from datetime import datetime
+import os
+import time
 
 PHASES = [
     ("Phase 1", "phases/Phase 1/placement_emails.csv", "Email extraction"),
@@ -15,24 +15,51 @@ PHASES = [
     ("Phase 6", "phases/Phase 6/excel_reports", "Excel reports"),
 ]
 
+
+def scan_outputs(paths):
+    """Scan each output directory once and map existing output paths to DirEntry."""
+    found = {}
+    # directory -> {entry name: output path as given}, so results are keyed
+    # by the caller's path string regardless of the OS path separator
+    wanted = {}
+    for output_path in paths:
+        directory, name = os.path.split(output_path)
+        wanted.setdefault(directory, {})[name] = output_path
+    
+    for directory, names in wanted.items():
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name in names:
+                        found[names[entry.name]] = entry
+        except FileNotFoundError:
+            continue
+    
+    return found
+
+
+outputs = scan_outputs(output_path for _, output_path, _ in PHASES)
+
 print("\n" + "=" * 70)
 print("PLACEMENT MAIL ANALYSIS SYSTEM - PIPELINE STATUS")
 print("=" * 70 + "\n")
 
 completed = 0
 for phase_name, output_path, description in PHASES:
-    path = Path(output_path)
-    status = "[OK]" if path.exists() else "[--]"
+    entry = outputs.get(output_path)
     
-    if path.exists():
+    if entry is not None:
+        status = "[OK]"
         completed += 1
-        if path.is_file():
-            size = path.stat().st_size
-            mod_time = datetime.fromtimestamp(path.stat().st_mtime)
-            info = f"({size:,} bytes, modified {mod_time.strftime('%Y-%m-%d %H:%M')})"
+        if entry.is_file():
+            st = entry.stat()
+            t = time.localtime(st.st_mtime_ns // 1_000_000_000)
+            mod_time = f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d}"
+            info = f"({st.st_size:,} bytes, modified {mod_time})"
         else:
             info = "(directory exists)"
     else:
+        status = "[--]"
         info = "(not found)"
     
     print(f"{status} {phase_name:20} {description:25} {info}")
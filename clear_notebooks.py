@@ -4,26 +4,108 @@ Clear all Jupyter notebook outputs before committing to GitHub.
 Removes personal data from cell outputs.
 """
 
+import os
+import sys
 import subprocess
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+def _iter_ipynb(root):
+    """Yield paths of all .ipynb files under root using os.scandir."""
+    try:
+        entries = os.scandir(root)
+    except FileNotFoundError:
+        # No such directory, so no notebooks (as glob would report)
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_ipynb(entry.path)
+            elif entry.name.endswith(".ipynb"):
+                yield entry.path
+
+
+def _has_outputs(path):
+    """Return True if any cell in the notebook has outputs or an execution count."""
+    try:
+        with open(path, 'rb') as f:
+            notebook = _json_loads(f.read())
+    except (OSError, ValueError):
+        # Let nbconvert deal with anything we can't parse
+        return True
+    
+    return any(
+        cell.get("outputs") or cell.get("execution_count") is not None
+        for cell in notebook.get("cells", [])
+    )
+
+
+def _run_nbconvert(batch):
+    """
+    Clear outputs for a batch of notebooks with one nbconvert process.
+    
+    nbconvert stops at the first notebook it can't convert, so a failed
+    batch is retried one notebook at a time. Returns (path, error) pairs for
+    the notebooks that still failed.
+    """
+    try:
+        result = subprocess.run([
+            "jupyter", "nbconvert",
+            "--clear-output", "--inplace",
+            *batch
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    except FileNotFoundError:
+        return [(nb, "jupyter not found") for nb in batch]
+    
+    if result.returncode == 0:
+        return []
+    if len(batch) == 1:
+        lines = result.stderr.strip().splitlines()
+        return [(batch[0], lines[-1] if lines else f"exit code {result.returncode}")]
+    
+    failed = []
+    for nb in batch:
+        failed.extend(_run_nbconvert([nb]))
+    return failed
 
 
 def clear_notebooks():
+    """Clear outputs of all notebooks under phases/. Returns True on success."""
     print("Clearing notebook outputs...")
     
-    notebooks = list(Path("phases").rglob("*.ipynb"))
+    all_notebooks = list(_iter_ipynb("phases"))
+    notebooks = [nb for nb in all_notebooks if _has_outputs(nb)]
     
     for nb in notebooks:
         print(f"  Clearing: {nb}")
-        subprocess.run([
-            "jupyter", "nbconvert",
-            "--clear-output", "--inplace",
-            str(nb)
-        ], capture_output=True)
     
-    print(f"\n[OK] Cleared {len(notebooks)} notebooks")
+    # Split notebooks into one batch per worker so Jupyter's startup cost
+    # is paid once per worker while the batches run concurrently
+    failed = []
+    if notebooks:
+        workers = min(8, os.cpu_count() or 4, len(notebooks))
+        batches = [notebooks[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for batch_failed in executor.map(_run_nbconvert, batches):
+                failed.extend(batch_failed)
+    
+    if failed:
+        print(f"\n[FAILED] Could not clear {len(failed)} notebook(s):")
+        for nb, error in failed:
+            print(f"  {nb}: {error}")
+        print("Do NOT commit until these notebooks are cleared.")
+        return False
+    
+    skipped = len(all_notebooks) - len(notebooks)
+    print(f"\n[OK] Cleared {len(notebooks)} notebooks ({skipped} already clean)")
     print("Safe to commit to GitHub!")
+    return True
 
 
 if __name__ == "__main__":
-    clear_notebooks()
+    sys.exit(0 if clear_notebooks() else 1)
@@ -11,29 +11,32 @@ License: MIT
 
 import sys
 
+BANNER = f"""{"=" * 60}
+Placement Mail Analysis System
+{"=" * 60}
+
+Available commands:
+
+  python run_web.py      - Start web interface
+  python run_pipeline.py - Run data pipeline
+  python setup_env.py    - Setup environment
+  python check_status.py - Check pipeline status
+
+Web Interface: http://localhost:8000
+API Docs:      http://localhost:8000/docs
+
+{"=" * 60}
+"""
+
 
 def main():
     """Main entry point for the application."""
-    print("=" * 60)
-    print("Placement Mail Analysis System")
-    print("=" * 60)
-    print()
-    print("Available commands:")
-    print()
-    print("  python run_web.py      - Start web interface")
-    print("  python run_pipeline.py - Run data pipeline")
-    print("  python setup_env.py    - Setup environment")
-    print("  python check_status.py - Check pipeline status")
-    print()
-    print("Web Interface: http://localhost:8000")
-    print("API Docs:      http://localhost:8000/docs")
-    print()
-    print("=" * 60)
-    
-    # Check if user wants to start web server
+    # Start the web server straight away without printing the help banner
     if len(sys.argv) > 1 and sys.argv[1] == "web":
         from run_web import main as run_web
-        run_web()
+        return run_web()
+    
+    sys.stdout.write(BANNER)
 
 
 if __name__ == "__main__":
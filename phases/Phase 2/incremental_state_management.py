@@ -4,11 +4,92 @@ This module provides functions to track processed emails and enable incremental
 """
 
 import os
+import queue
 import logging
-from typing import Set
+import tempfile
+import threading
+from typing import Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger("AI_Cleaning")
 
+# Processed IDs already known to be on disk, keyed by state file path,
+# with the file's (size, mtime_ns) when they were last read or written
+_STATE_CACHE: Dict[str, Tuple[Optional[Tuple[int, int]], Set[str]]] = {}
+
+# IDs already written to the checkpoint files, keyed by state directory
+_CHECKPOINT_CACHE: Dict[str, Set[str]] = {}
+
+
+def _read_id_lines(path: str) -> List[str]:
+    """Read one ID per line, skipping blanks, with a single read call."""
+    with open(path, 'r', encoding='utf-8') as f:
+        lines = f.read().splitlines()
+    return [stripped for line in lines if (stripped := line.strip())]
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """(size, mtime_ns) of path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def _encode_ids(ids) -> bytes:
+    """Encode IDs as one newline-terminated buffer for a single write call."""
+    if not ids:
+        return b""
+    return ("\n".join(ids) + "\n").encode('utf-8')
+
+
+def _fsync_directory(path: str) -> None:
+    """Flush directory metadata (renames, new files) for path's parent to disk."""
+    if os.name == "nt":
+        # Directories can't be opened for fsync on Windows
+        return
+    fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_ids_atomic(
+    path: str,
+    ids: Set[str],
+    durable: bool = True,
+    sort: bool = False
+) -> None:
+    """
+    Write IDs to a temp file and move it over path in one atomic step.
+    
+    Loaders build a set, so order only matters for readable diffs; pass
+    sort=True where that is worth an O(N log N) sort.
+    """
+    # Unique temp name in the target directory, so concurrent writers
+    # never share (and truncate) each other's temp file
+    fd, temp_file = tempfile.mkstemp(
+        prefix=os.path.basename(path) + ".",
+        suffix=".tmp",
+        dir=os.path.dirname(path) or "."
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_encode_ids(sorted(ids) if sort else ids))
+            f.flush()
+            os.fsync(f.fileno())
+        
+        # os.replace overwrites atomically on both POSIX and Windows
+        os.replace(temp_file, path)
+        if durable:
+            _fsync_directory(path)
+    except Exception:
+        # Clean up temp file if it exists
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        raise
+
 
 def load_processed_ids(state_file: str) -> Set[str]:
     """
@@ -25,8 +106,7 @@ def load_processed_ids(state_file: str) -> Set[str]:
         return set()
     
     try:
-        with open(state_file, 'r', encoding='utf-8') as f:
-            processed_ids = {line.strip() for line in f if line.strip()}
+        processed_ids = set(_read_id_lines(state_file))
         logger.info(f"Loaded {len(processed_ids)} processed message IDs from state")
         return processed_ids
     except Exception as e:
@@ -34,82 +114,238 @@ def load_processed_ids(state_file: str) -> Set[str]:
         return set()
 
 
-def save_processed_ids(state_file: str, new_ids: Set[str]) -> None:
+def save_processed_ids(
+    state_file: str,
+    new_ids: Set[str],
+    existing_ids: Optional[Set[str]] = None,
+    durable: bool = True
+) -> None:
     """
     Append new processed IDs to existing set and persist to disk.
     
+    The state file is an append-only log: only IDs not already recorded are
+    written. It is read on the first save for a given path; later saves
+    merge against the in-memory copy while the file's size and mtime show
+    nobody else has changed it.
+    
     Args:
         state_file: Path to the state file
         new_ids: Set of new message IDs to save
+        existing_ids: Already persisted IDs, if the caller has them loaded
+        durable: fsync the state file and its directory before returning
     """
-    # Load existing IDs
-    existing_ids = load_processed_ids(state_file)
+    # Reuse the IDs read or written last time, unless the file changed since
+    cached = _STATE_CACHE.get(state_file)
+    if existing_ids is not None:
+        known_ids = set(existing_ids)
+    elif cached is not None and cached[0] == _file_signature(state_file):
+        known_ids = cached[1]
+    else:
+        known_ids = load_processed_ids(state_file)
     
-    # Merge with new IDs
-    merged_ids = existing_ids.union(new_ids)
+    # Only IDs not yet in the state file need to be written
+    added_ids = new_ids - known_ids
     
     # Create directory if it doesn't exist
     os.makedirs(os.path.dirname(state_file) or ".", exist_ok=True)
     
     try:
-        # Write to temp file first (atomic write)
-        temp_file = state_file + ".tmp"
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            for msg_id in sorted(merged_ids):
-                f.write(f"{msg_id}\n")
+        # Append new IDs to the log; use compact_state_file() to rewrite it
+        created = not os.path.exists(state_file)
+        data = _encode_ids(added_ids)
+        with open(state_file, 'a+b') as f:
+            # Start on a new line if an earlier writer stopped mid-line
+            if data and f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    data = b"\n" + data
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        if durable and created:
+            _fsync_directory(state_file)
+        known_ids.update(added_ids)
+        _STATE_CACHE[state_file] = (_file_signature(state_file), known_ids)
         
-        # Rename temp file to actual file (atomic operation)
-        if os.path.exists(state_file):
-            os.remove(state_file)
-        os.rename(temp_file, state_file)
-        
-        logger.info(f"Saved {len(merged_ids)} total processed IDs to state ({len(new_ids)} new)")
+        logger.info(f"Saved {len(known_ids)} total processed IDs to state ({len(added_ids)} new)")
     except Exception as e:
         logger.error(f"Failed to save state file {state_file}: {e}")
-        # Clean up temp file if it exists
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
+
+
+def compact_state_file(
+    state_file: str,
+    threshold_ratio: float = 2.0,
+    durable: bool = True
+) -> bool:
+    """
+    Rewrite the state file without duplicate lines once it has grown too large.
+    
+    Args:
+        state_file: Path to the state file
+        threshold_ratio: Rewrite when total lines / unique IDs exceeds this ratio
+        durable: fsync the parent directory after the atomic rename
+        
+    Returns:
+        True if the file was rewritten, False otherwise
+    """
+    if not os.path.exists(state_file):
+        return False
+    
+    try:
+        lines = _read_id_lines(state_file)
+    except Exception as e:
+        logger.warning(f"Failed to read state file {state_file}: {e}")
+        return False
+    
+    unique_ids = set(lines)
+    if len(lines) <= threshold_ratio * max(len(unique_ids), 1):
+        return False
+    
+    try:
+        _write_ids_atomic(state_file, unique_ids, durable, sort=True)
+        _STATE_CACHE[state_file] = (_file_signature(state_file), unique_ids)
+        
+        logger.info(f"Compacted state file: {len(lines)} lines -> {len(unique_ids)} IDs")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to compact state file {state_file}: {e}")
+        return False
 
 
 def get_checkpoint_file(state_dir: str) -> str:
-    """Get path to checkpoint file for recovery."""
+    """Get path to checkpoint snapshot file for recovery."""
     return os.path.join(state_dir, "checkpoint.txt")
 
 
-def save_checkpoint(state_dir: str, processed_ids: Set[str]) -> None:
-    """Save checkpoint for crash recovery."""
-    checkpoint_file = get_checkpoint_file(state_dir)
+def get_checkpoint_delta_file(state_dir: str) -> str:
+    """Get path to checkpoint delta log (IDs added since the last snapshot)."""
+    return os.path.join(state_dir, "checkpoint.delta")
+
+
+def save_checkpoint(
+    state_dir: str,
+    processed_ids: Set[str],
+    durable: bool = True
+) -> None:
+    """
+    Save checkpoint for crash recovery.
+    
+    Only IDs not already checkpointed are appended to the delta log, so
+    passing the full running set each time costs O(new IDs).
+    """
+    delta_file = get_checkpoint_delta_file(state_dir)
     os.makedirs(state_dir, exist_ok=True)
     
+    checkpointed = _CHECKPOINT_CACHE.setdefault(state_dir, set())
+    new_ids = processed_ids - checkpointed
+    if not new_ids:
+        return
+    
     try:
-        with open(checkpoint_file, 'w', encoding='utf-8') as f:
-            for msg_id in sorted(processed_ids):
-                f.write(f"{msg_id}\n")
-        logger.debug(f"Checkpoint saved: {len(processed_ids)} IDs")
+        with open(delta_file, 'ab') as f:
+            f.write(_encode_ids(new_ids))
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        checkpointed.update(new_ids)
+        logger.debug(f"Checkpoint saved: {len(new_ids)} new IDs ({len(checkpointed)} total)")
     except Exception as e:
         logger.warning(f"Failed to save checkpoint: {e}")
 
 
-def load_checkpoint(state_dir: str) -> Set[str]:
-    """Load checkpoint for crash recovery."""
+def full_checkpoint(
+    state_dir: str,
+    all_ids: Set[str],
+    durable: bool = True
+) -> None:
+    """Write a full checkpoint snapshot and truncate the delta log."""
     checkpoint_file = get_checkpoint_file(state_dir)
-    if os.path.exists(checkpoint_file):
+    delta_file = get_checkpoint_delta_file(state_dir)
+    os.makedirs(state_dir, exist_ok=True)
+    
+    try:
+        _write_ids_atomic(checkpoint_file, all_ids, durable)
+        if os.path.exists(delta_file):
+            os.remove(delta_file)
+        _CHECKPOINT_CACHE[state_dir] = set(all_ids)
+        logger.debug(f"Checkpoint snapshot saved: {len(all_ids)} IDs")
+    except Exception as e:
+        logger.warning(f"Failed to save checkpoint snapshot: {e}")
+
+
+class CheckpointWriter(threading.Thread):
+    """
+    Write checkpoints on a background thread so processing doesn't wait on disk.
+    
+    Usage:
+        with CheckpointWriter(STATE_DIR) as writer:
+            ...
+            writer.submit(processed_ids)  # returns immediately
+        clear_checkpoint(STATE_DIR)  # safe: all writes flushed on exit
+    
+    The bounded queue applies back-pressure if the disk falls behind.
+    """
+    
+    _STOP = object()
+    
+    def __init__(self, state_dir: str, maxsize: int = 4, durable: bool = True):
+        super().__init__(name="CheckpointWriter", daemon=True)
+        self.state_dir = state_dir
+        self.durable = durable
+        self._queue: "queue.Queue" = queue.Queue(maxsize=maxsize)
+    
+    def submit(self, processed_ids: Set[str]) -> None:
+        """Queue a checkpoint of processed_ids (copied, so callers may keep mutating it)."""
+        self._queue.put(set(processed_ids))
+    
+    def run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            save_checkpoint(self.state_dir, item, self.durable)
+    
+    def close(self) -> None:
+        """Write any queued checkpoints and stop the thread."""
+        if self.is_alive():
+            self._queue.put(self._STOP)
+            self.join()
+    
+    def __enter__(self) -> "CheckpointWriter":
+        self.start()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_checkpoint(state_dir: str) -> Set[str]:
+    """Load checkpoint (snapshot plus delta log) for crash recovery."""
+    ids: Set[str] = set()
+    for checkpoint_file in (get_checkpoint_file(state_dir),
+                            get_checkpoint_delta_file(state_dir)):
+        if not os.path.exists(checkpoint_file):
+            continue
         try:
-            with open(checkpoint_file, 'r', encoding='utf-8') as f:
-                ids = {line.strip() for line in f if line.strip()}
-            logger.info(f"Loaded checkpoint: {len(ids)} IDs")
-            return ids
+            ids.update(_read_id_lines(checkpoint_file))
         except Exception as e:
             logger.warning(f"Failed to load checkpoint: {e}")
-    return set()
+    
+    if ids:
+        logger.info(f"Loaded checkpoint: {len(ids)} IDs")
+    _CHECKPOINT_CACHE[state_dir] = set(ids)
+    return ids
 
 
 def clear_checkpoint(state_dir: str) -> None:
-    """Clear checkpoint file after successful completion."""
-    checkpoint_file = get_checkpoint_file(state_dir)
-    if os.path.exists(checkpoint_file):
-        try:
-            os.remove(checkpoint_file)
-            logger.debug("Checkpoint cleared")
-        except Exception as e:
-            logger.warning(f"Failed to clear checkpoint: {e}")
+    """Clear checkpoint files after successful completion."""
+    _CHECKPOINT_CACHE.pop(state_dir, None)
+    for checkpoint_file in (get_checkpoint_file(state_dir),
+                            get_checkpoint_delta_file(state_dir)):
+        if os.path.exists(checkpoint_file):
+            try:
+                os.remove(checkpoint_file)
+                logger.debug("Checkpoint cleared")
+            except Exception as e:
+                logger.warning(f"Failed to clear checkpoint: {e}")
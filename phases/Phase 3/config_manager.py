@@ -4,182 +4,616 @@ Handles loading, validation, and management of all Phase 3 settings.
 """
 
 import os
+import re
+import copy
 import json
+import mmap
 import logging
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Callable, FrozenSet, List, Optional, Tuple
 from pathlib import Path
 
 logger = logging.getLogger("ConfigurationManager")
 
+# orjson parses/serializes config files several times faster when installed
+try:
+    import orjson
+    
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    
+    # orjson parses memoryviews, so large files can be parsed from an mmap
+    _JSON_PARSES_BUFFERS = True
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+    
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    
+    _JSON_PARSES_BUFFERS = False
 
-class ConfigurationManager:
-    """
-    Manages configuration for Phase 3 Entity Structuring Pipeline.
-    Handles loading, validation, and default configuration creation.
+# Config files larger than this are parsed from an mmap instead of being
+# copied into a bytes object first
+_MMAP_THRESHOLD = 1 << 20
+
+
+def _compile_alternation(
+    terms,
+    prefix: str = "",
+    suffix: str = ""
+) -> "re.Pattern":
     """
+    Compile terms into one case-insensitive alternation regex.
     
-    DEFAULT_CONFIG = {
-        "incremental_processing": {
-            "enabled": True,
-            "state_directory": "state",
-            "state_file": "processed_message_ids.txt",
-            "checkpoint_interval": 50,
-            "force_full_reprocess": False
-        },
-        "input_output": {
-            "input_file": "../Phase 2/relevant_placement_emails.csv",
-            "output_csv": "structured_job_postings.csv",
-            "output_json": "structured_job_postings.json"
+    Terms are sorted longest-first so overlapping keys (e.g. "new delhi"
+    vs "delhi") match the most specific one, and are bounded by
+    lookarounds rather than \\b so keys ending in punctuation still match
+    and "js" inside "node.js" does not.
+    """
+    alternation = "|".join(
+        re.escape(term) for term in sorted(terms, key=len, reverse=True)
+    )
+    if not alternation:
+        # Never matches
+        return re.compile(r"(?!)")
+    return re.compile(
+        rf"{prefix}(?<![\w.])({alternation})(?!\w){suffix}", re.IGNORECASE
+    )
+
+
+# Backreferences and conditionals that name a group by number (\1,
+# \g<1>, (?(1)...)), not preceded by an escaping backslash
+_NUMBERED_GROUP_REF = re.compile(
+    r"(?<!\\)(?:\\\\)*(?:\\[1-9]|\\g<\d+>|\(\?\(\d+\))"
+)
+
+
+def _compile_pattern(setting: str, pattern: Any, flags: int = 0) -> "re.Pattern":
+    """Compile a configured regex, naming the setting if it is invalid."""
+    try:
+        return re.compile(pattern, flags)
+    except (re.error, TypeError) as e:
+        raise ValueError(f"Invalid pattern in {setting}: {pattern!r} ({e})") from None
+
+
+# Default configuration, written out when no config file exists
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "incremental_processing": {
+        "enabled": True,
+        "state_directory": "state",
+        "state_file": "processed_message_ids.txt",
+        "checkpoint_interval": 50,
+        "force_full_reprocess": False
+    },
+    "input_output": {
+        "input_file": "../Phase 2/relevant_placement_emails.csv",
+        "output_csv": "structured_job_postings.csv",
+        "output_json": "structured_job_postings.json"
+    },
+    "processing": {
+        "max_jobs_per_email": 5,
+        "min_completeness_score": 0.3,
+        "enable_analytics": True,
+        "max_companies_per_email": 3,
+        "max_positions_per_email": 3
+    },
+    "logging": {
+        "level": "INFO",
+        "file": "entity_structuring.log",
+        "enable_performance_metrics": True
+    },
+    "normalization": {
+        "skill_map": {
+            "js": "javascript",
+            "ts": "typescript",
+            "py": "python",
+            "reactjs": "react",
+            "nodejs": "node.js",
+            "ml": "machine learning",
+            "ai": "artificial intelligence",
+            "dl": "deep learning",
+            "nlp": "natural language processing",
+            "cv": "computer vision",
+            "k8s": "kubernetes",
+            "tf": "tensorflow",
+            "scikit": "scikit-learn"
         },
-        "processing": {
-            "max_jobs_per_email": 5,
-            "min_completeness_score": 0.3,
-            "enable_analytics": True,
-            "max_companies_per_email": 3,
-            "max_positions_per_email": 3
+        "degree_map": {
+            "btech": "B.Tech",
+            "b.tech": "B.Tech",
+            "be": "B.E",
+            "b.e": "B.E",
+            "mtech": "M.Tech",
+            "m.tech": "M.Tech",
+            "me": "M.E",
+            "m.e": "M.E",
+            "bca": "BCA",
+            "mca": "MCA",
+            "bsc": "B.Sc",
+            "b.sc": "B.Sc",
+            "msc": "M.Sc",
+            "m.sc": "M.Sc"
         },
-        "logging": {
-            "level": "INFO",
-            "file": "entity_structuring.log",
-            "enable_performance_metrics": True
+        "city_map": {
+            "bangalore": "Bangalore",
+            "bengaluru": "Bangalore",
+            "blr": "Bangalore",
+            "mumbai": "Mumbai",
+            "bombay": "Mumbai",
+            "delhi": "Delhi",
+            "new delhi": "Delhi",
+            "ncr": "Delhi NCR",
+            "gurgaon": "Gurgaon",
+            "gurugram": "Gurgaon",
+            "hyderabad": "Hyderabad",
+            "pune": "Pune",
+            "chennai": "Chennai",
+            "kolkata": "Kolkata",
+            "calcutta": "Kolkata"
         },
-        "normalization": {
-            "skill_map": {
-                "js": "javascript",
-                "ts": "typescript",
-                "py": "python",
-                "reactjs": "react",
-                "nodejs": "node.js",
-                "ml": "machine learning",
-                "ai": "artificial intelligence",
-                "dl": "deep learning",
-                "nlp": "natural language processing",
-                "cv": "computer vision",
-                "k8s": "kubernetes",
-                "tf": "tensorflow",
-                "scikit": "scikit-learn"
+        "company_suffixes": [
+            "PVT LTD",
+            "PVT. LTD.",
+            "PRIVATE LIMITED",
+            "LIMITED",
+            "LTD",
+            "INC",
+            "CORP",
+            "CORPORATION",
+            "LLC"
+        ]
+    },
+    "position_levels": {
+        "senior_keywords": ["senior", "lead", "principal", "staff"],
+        "junior_keywords": ["junior", "associate", "entry"],
+        "intern_keywords": ["intern", "trainee"],
+        "manager_keywords": ["manager", "head", "director"]
+    },
+    "work_mode_keywords": {
+        "remote": ["remote", "wfh", "work from home", "anywhere"],
+        "hybrid": ["hybrid"]
+    },
+    "experience_types": {
+        "fresher_keywords": ["fresher", "freshers", "entry level"],
+        "thresholds": {
+            "entry_level_max": 2,
+            "mid_level_max": 5
+        }
+    },
+    "salary_parsing": {
+        "patterns": [
+            {
+                "name": "lpa_range",
+                "pattern": r"(\d+(?:\.\d+)?)\s*(?:-|to)\s*(\d+(?:\.\d+)?)\s*(?:lpa|lakhs?\s+per\s+annum)",
+                "confidence": 0.9
             },
-            "degree_map": {
-                "btech": "B.Tech",
-                "b.tech": "B.Tech",
-                "be": "B.E",
-                "b.e": "B.E",
-                "mtech": "M.Tech",
-                "m.tech": "M.Tech",
-                "me": "M.E",
-                "m.e": "M.E",
-                "bca": "BCA",
-                "mca": "MCA",
-                "bsc": "B.Sc",
-                "b.sc": "B.Sc",
-                "msc": "M.Sc",
-                "m.sc": "M.Sc"
+            {
+                "name": "lpa_single",
+                "pattern": r"(\d+(?:\.\d+)?)\s*(?:lpa|lakhs?\s+per\s+annum)",
+                "confidence": 0.85
             },
-            "city_map": {
-                "bangalore": "Bangalore",
-                "bengaluru": "Bangalore",
-                "blr": "Bangalore",
-                "mumbai": "Mumbai",
-                "bombay": "Mumbai",
-                "delhi": "Delhi",
-                "new delhi": "Delhi",
-                "ncr": "Delhi NCR",
-                "gurgaon": "Gurgaon",
-                "gurugram": "Gurgaon",
-                "hyderabad": "Hyderabad",
-                "pune": "Pune",
-                "chennai": "Chennai",
-                "kolkata": "Kolkata",
-                "calcutta": "Kolkata"
+            {
+                "name": "monthly",
+                "pattern": r"(\d+)k?\s*(?:per\s+month|pm|/month)",
+                "confidence": 0.8
             },
-            "company_suffixes": [
-                "PVT LTD",
-                "PVT. LTD.",
-                "PRIVATE LIMITED",
-                "LIMITED",
-                "LTD",
-                "INC",
-                "CORP",
-                "CORPORATION",
-                "LLC"
-            ]
-        },
-        "position_levels": {
-            "senior_keywords": ["senior", "lead", "principal", "staff"],
-            "junior_keywords": ["junior", "associate", "entry"],
-            "intern_keywords": ["intern", "trainee"],
-            "manager_keywords": ["manager", "head", "director"]
-        },
-        "work_mode_keywords": {
-            "remote": ["remote", "wfh", "work from home", "anywhere"],
-            "hybrid": ["hybrid"]
-        },
-        "experience_types": {
-            "fresher_keywords": ["fresher", "freshers", "entry level"],
-            "thresholds": {
-                "entry_level_max": 2,
-                "mid_level_max": 5
+            {
+                "name": "ctc",
+                "pattern": r"ctc\s*:?\s*(\d+(?:\.\d+)?)\s*(?:lpa|lakhs?)",
+                "confidence": 0.85
+            },
+            {
+                "name": "package_range",
+                "pattern": r"package\s*:?\s*(\d+(?:\.\d+)?)\s*(?:-|to)\s*(\d+(?:\.\d+)?)\s*lakhs?",
+                "confidence": 0.85
             }
+        ],
+        "default_currency": "INR",
+        "default_period": "annual"
+    },
+    "experience_parsing": {
+        "patterns": [
+            r"(\d+)\s*(?:-|to)\s*(\d+)\s*years?",
+            r"(\d+)\s*years?\s+(?:of\s+)?experience",
+            r"0\s*(?:-|to)\s*(\d+)\s*years?"
+        ]
+    },
+    "deadline_parsing": {
+        "date_patterns": [
+            {
+                "pattern": r"(\d{1,2})[-/](\d{1,2})[-/](\d{4})",
+                "format": "%d-%m-%Y"
+            },
+            {
+                "pattern": r"(\d{1,2})[-/](\d{1,2})[-/](\d{2})",
+                "format": "%d-%m-%y"
+            },
+            {
+                "pattern": r"(\d{4})[-/](\d{1,2})[-/](\d{1,2})",
+                "format": "%Y-%m-%d"
+            }
+        ],
+        "relative_keywords": {
+            "today": 0,
+            "tomorrow": 1
+        }
+    }
+}
+
+
+# Example configuration with inline documentation keys, written by
+# create_example_config()
+_EXAMPLE_CONFIG: Dict[str, Any] = {
+    "_comment": "Phase 3 Entity Structuring Configuration",
+    "_description": "This file controls all Phase 3 processing behavior",
+    
+    "incremental_processing": {
+        "_comment": "Incremental processing settings",
+        "enabled": True,
+        "_enabled_description": "Enable incremental processing (only process new emails)",
+        
+        "state_directory": "state",
+        "_state_directory_description": "Directory to store state files",
+        
+        "state_file": "processed_message_ids.txt",
+        "_state_file_description": "File name for tracking processed email IDs",
+        
+        "checkpoint_interval": 50,
+        "_checkpoint_interval_description": "Save checkpoint every N emails for crash recovery",
+        
+        "force_full_reprocess": False,
+        "_force_full_reprocess_description": "Set to true to reprocess all emails (ignores state)"
+    },
+    
+    "input_output": {
+        "_comment": "Input and output file paths",
+        "input_file": "../Phase 2/relevant_placement_emails.csv",
+        "_input_file_description": "Path to Phase 2 output CSV (relative to Phase 3 directory)",
+        
+        "output_csv": "structured_job_postings.csv",
+        "_output_csv_description": "Output CSV file name",
+        
+        "output_json": "structured_job_postings.json",
+        "_output_json_description": "Output JSON file name"
+    },
+    
+    "processing": {
+        "_comment": "Processing parameters",
+        "max_jobs_per_email": 5,
+        "_max_jobs_per_email_description": "Maximum job postings to extract per email",
+        
+        "min_completeness_score": 0.3,
+        "_min_completeness_score_description": "Minimum completeness score (0.0-1.0) to include job",
+        
+        "enable_analytics": True,
+        "_enable_analytics_description": "Generate analytics report after processing"
+    },
+    
+    "logging": {
+        "_comment": "Logging configuration",
+        "level": "INFO",
+        "_level_description": "Log level: DEBUG, INFO, WARNING, ERROR, CRITICAL",
+        
+        "file": "entity_structuring.log",
+        "_file_description": "Log file name",
+        
+        "enable_performance_metrics": True,
+        "_enable_performance_metrics_description": "Log performance metrics and timing"
+    }
+}
+
+
+# Sentinel for lookups where None is a valid configured value
+_MISSING = object()
+
+_LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+_POSITIVE_INT = (
+    lambda value: value > 0,
+    "{field} must be a positive integer, got {value}"
+)
+
+# Validation schema: section -> field -> spec, where spec has
+#   type:   expected type (or tuple of types)
+#   check:  optional (predicate, message) applied once the type matches
+#   fields: optional nested schema for dict values
+#   items:  optional (label, required keys) for lists of dicts
+#   of:     optional type every item of a list must have
+_SCHEMA: Dict[str, Dict[str, Dict[str, Any]]] = {
+    "incremental_processing": {
+        "enabled": {"type": bool},
+        "state_directory": {"type": str},
+        "state_file": {"type": str},
+        "checkpoint_interval": {"type": int, "check": _POSITIVE_INT},
+        "force_full_reprocess": {"type": bool}
+    },
+    "input_output": {
+        "input_file": {"type": str},
+        "output_csv": {"type": str},
+        "output_json": {"type": str}
+    },
+    "processing": {
+        "max_jobs_per_email": {"type": int, "check": _POSITIVE_INT},
+        "min_completeness_score": {
+            "type": (int, float),
+            "check": (
+                lambda value: 0.0 <= value <= 1.0,
+                "{field} must be between 0.0 and 1.0, got {value}"
+            )
         },
-        "salary_parsing": {
-            "patterns": [
-                {
-                    "name": "lpa_range",
-                    "pattern": r"(\d+(?:\.\d+)?)\s*(?:-|to)\s*(\d+(?:\.\d+)?)\s*(?:lpa|lakhs?\s+per\s+annum)",
-                    "confidence": 0.9
-                },
-                {
-                    "name": "lpa_single",
-                    "pattern": r"(\d+(?:\.\d+)?)\s*(?:lpa|lakhs?\s+per\s+annum)",
-                    "confidence": 0.85
-                },
-                {
-                    "name": "monthly",
-                    "pattern": r"(\d+)k?\s*(?:per\s+month|pm|/month)",
-                    "confidence": 0.8
-                },
-                {
-                    "name": "ctc",
-                    "pattern": r"ctc\s*:?\s*(\d+(?:\.\d+)?)\s*(?:lpa|lakhs?)",
-                    "confidence": 0.85
-                },
-                {
-                    "name": "package_range",
-                    "pattern": r"package\s*:?\s*(\d+(?:\.\d+)?)\s*(?:-|to)\s*(\d+(?:\.\d+)?)\s*lakhs?",
-                    "confidence": 0.85
-                }
-            ],
-            "default_currency": "INR",
-            "default_period": "annual"
-        },
-        "experience_parsing": {
-            "patterns": [
-                r"(\d+)\s*(?:-|to)\s*(\d+)\s*years?",
-                r"(\d+)\s*years?\s+(?:of\s+)?experience",
-                r"0\s*(?:-|to)\s*(\d+)\s*years?"
-            ]
+        "enable_analytics": {"type": bool},
+        "max_companies_per_email": {"type": int, "check": _POSITIVE_INT},
+        "max_positions_per_email": {"type": int, "check": _POSITIVE_INT}
+    },
+    "logging": {
+        "level": {
+            "type": str,
+            "check": (
+                lambda value: value.upper() in _LOG_LEVELS,
+                "Invalid log level: {value}. "
+                f"Must be one of: {', '.join(_LOG_LEVELS)}"
+            )
         },
-        "deadline_parsing": {
-            "date_patterns": [
-                {
-                    "pattern": r"(\d{1,2})[-/](\d{1,2})[-/](\d{4})",
-                    "format": "%d-%m-%Y"
-                },
-                {
-                    "pattern": r"(\d{1,2})[-/](\d{1,2})[-/](\d{2})",
-                    "format": "%d-%m-%y"
-                },
-                {
-                    "pattern": r"(\d{4})[-/](\d{1,2})[-/](\d{1,2})",
-                    "format": "%Y-%m-%d"
-                }
-            ],
-            "relative_keywords": {
-                "today": 0,
-                "tomorrow": 1
+        "file": {"type": str},
+        "enable_performance_metrics": {"type": bool}
+    },
+    "normalization": {
+        "skill_map": {"type": dict},
+        "degree_map": {"type": dict},
+        "city_map": {"type": dict},
+        "company_suffixes": {"type": list, "of": str}
+    },
+    "position_levels": {
+        "senior_keywords": {"type": list, "of": str},
+        "junior_keywords": {"type": list, "of": str},
+        "intern_keywords": {"type": list, "of": str},
+        "manager_keywords": {"type": list, "of": str}
+    },
+    "work_mode_keywords": {
+        "remote": {"type": list, "of": str},
+        "hybrid": {"type": list, "of": str}
+    },
+    "experience_types": {
+        "fresher_keywords": {"type": list, "of": str},
+        "thresholds": {
+            "type": dict,
+            "fields": {
+                "entry_level_max": {"type": int},
+                "mid_level_max": {"type": int}
             }
         }
+    },
+    "salary_parsing": {
+        "patterns": {
+            "type": list,
+            "items": ("pattern", ["name", "pattern", "confidence"])
+        },
+        "default_currency": {"type": object},
+        "default_period": {"type": object}
+    },
+    "experience_parsing": {
+        "patterns": {"type": list, "of": str}
+    },
+    "deadline_parsing": {
+        "date_patterns": {
+            "type": list,
+            "items": ("date pattern", ["pattern", "format"])
+        },
+        "relative_keywords": {"type": dict}
     }
+}
+
+
+def _type_name(expected_type) -> str:
+    """Readable name for a type or tuple of types in error messages."""
+    if isinstance(expected_type, tuple):
+        return " or ".join(t.__name__ for t in expected_type)
+    return expected_type.__name__
+
+
+def _compile_field(
+    path: str,
+    field: str,
+    spec: Dict[str, Any]
+) -> Callable[[Dict[str, Any], List[str], bool], None]:
+    """
+    Compile one field spec into a validator closure.
+    
+    Messages, predicates and nested validators are resolved here once, so
+    validating a config only runs the checks that apply to each field.
+    With fail_fast, validators stop at the first recorded error.
+    """
+    expected_type = spec["type"]
+    missing_message = f"Missing required field in {path}: '{field}'"
+    type_message = (
+        f"Invalid type for {path}.{field}: "
+        f"expected {_type_name(expected_type)}, got "
+    )
+    steps: List[Callable[[Any, List[str], bool], None]] = []
+    
+    # Validate value
+    if "check" in spec:
+        predicate, message = spec["check"]
+        
+        def check_value(value: Any, errors: List[str], fail_fast: bool) -> None:
+            if not predicate(value):
+                errors.append(message.format(field=field, value=value))
+        
+        steps.append(check_value)
+    
+    # Validate nested dict
+    if "fields" in spec:
+        steps.append(_compile_section(f"{path}.{field}", spec["fields"]))
+    
+    # Validate each item of a list of dicts
+    if "items" in spec:
+        label, required_keys = spec["items"]
+        
+        def check_items(
+            value: List[Any],
+            errors: List[str],
+            fail_fast: bool
+        ) -> None:
+            for idx, item in enumerate(value):
+                if not isinstance(item, dict):
+                    errors.append(
+                        f"Invalid {label} at index {idx}: expected dict"
+                    )
+                elif any(key not in item for key in required_keys):
+                    errors.extend(
+                        f"Missing required field in {label} {idx}: '{key}'"
+                        for key in required_keys
+                        if key not in item
+                    )
+                else:
+                    continue
+                if fail_fast:
+                    return
+        
+        steps.append(check_items)
+    
+    # Validate the type of each list item
+    if "of" in spec:
+        item_type = spec["of"]
+        
+        def check_item_types(
+            value: List[Any],
+            errors: List[str],
+            fail_fast: bool
+        ) -> None:
+            for idx, item in enumerate(value):
+                if not isinstance(item, item_type):
+                    errors.append(
+                        f"Invalid type for {path}.{field}[{idx}]: expected "
+                        f"{_type_name(item_type)}, got {type(item).__name__}"
+                    )
+                    if fail_fast:
+                        return
+        
+        steps.append(check_item_types)
+    
+    def validate_field(
+        section: Dict[str, Any],
+        errors: List[str],
+        fail_fast: bool
+    ) -> None:
+        if field not in section:
+            errors.append(missing_message)
+            return
+        value = section[field]
+        if not isinstance(value, expected_type):
+            errors.append(type_message + type(value).__name__)
+            return
+        for step in steps:
+            step(value, errors, fail_fast)
+            if fail_fast and errors:
+                return
+    
+    return validate_field
+
+
+def _compile_section(
+    path: str,
+    fields: Dict[str, Dict[str, Any]]
+) -> Callable[[Any, List[str], bool], None]:
+    """Compile a section schema into a validator that collects error messages."""
+    validators = tuple(
+        _compile_field(path, field, spec) for field, spec in fields.items()
+    )
+    
+    def validate_section(
+        section: Any,
+        errors: List[str],
+        fail_fast: bool
+    ) -> None:
+        if not isinstance(section, dict):
+            errors.append(
+                f"Invalid type for {path}: "
+                f"expected dict, got {type(section).__name__}"
+            )
+            return
+        for validate in validators:
+            validate(section, errors, fail_fast)
+            if fail_fast and errors:
+                return
+    
+    return validate_section
+
+
+def _compile_config(
+    schema: Dict[str, Dict[str, Dict[str, Any]]]
+) -> Callable[[Dict[str, Any], bool], List[str]]:
+    """
+    Compile the whole config schema into one validator.
+    
+    The returned function checks required sections and every field in a
+    single pass and returns the collected error messages (only the first
+    one when fail_fast is set).
+    """
+    sections = tuple(
+        (section_name, _compile_section(section_name, fields))
+        for section_name, fields in schema.items()
+    )
+    
+    def validate(config: Dict[str, Any], fail_fast: bool = False) -> List[str]:
+        # Check required top-level keys before descending
+        errors = [
+            f"Missing required configuration section: '{section_name}'"
+            for section_name, _ in sections
+            if section_name not in config
+        ]
+        if errors:
+            return errors[:1] if fail_fast else errors
+        for section_name, validate_section in sections:
+            validate_section(config[section_name], errors, fail_fast)
+            if fail_fast and errors:
+                break
+        return errors
+    
+    return validate
+
+
+# Schema compiled once at import instead of being interpreted per config
+_validate_schema = _compile_config(_SCHEMA)
+
+
+@lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot-separated setting key, reusing the tuple for repeat lookups."""
+    return tuple(key.split('.'))
+
+
+def _parse_config_file(f) -> Any:
+    """
+    Parse an open config file.
+    
+    Small files are read into memory; large ones are parsed straight from
+    the page cache through an mmap when the JSON backend supports it.
+    """
+    if (
+        _JSON_PARSES_BUFFERS
+        and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD
+    ):
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return _json_loads(view)
+    
+    return _json_loads(f.read())
+
+
+class ConfigurationManager:
+    """
+    Manages configuration for Phase 3 Entity Structuring Pipeline.
+    Handles loading, validation, and default configuration creation.
+    """
+    
+    # Read-only view; load_config() deep-copies before handing out a config
+    DEFAULT_CONFIG = MappingProxyType(_DEFAULT_CONFIG)
     
     def __init__(self, config_path: str = "config.json"):
         """
@@ -190,7 +624,8 @@ class ConfigurationManager:
         """
         self.config_path = config_path
         self.config: Dict[str, Any] = {}
-        self.logger = logging.getLogger("ConfigurationManager")
+        self.compiled: Dict[str, Any] = {}
+        self.keyword_sets: Dict[str, FrozenSet[str]] = {}
     
     def load_config(self) -> Dict[str, Any]:
         """
@@ -205,30 +640,30 @@ class ConfigurationManager:
         """
         # Check if config file exists
         if not os.path.exists(self.config_path):
-            self.logger.warning(
-                f"Configuration file not found at {self.config_path}"
+            logger.warning(
+                "Configuration file not found at %s", self.config_path
             )
-            self.logger.info("Creating default configuration file...")
+            logger.info("Creating default configuration file...")
             self.create_default_config()
-            self.config = self.DEFAULT_CONFIG.copy()
+            self.config = copy.deepcopy(_DEFAULT_CONFIG)
         else:
             # Load existing config
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    self.config = json.load(f)
-                self.logger.info(
-                    f"Configuration loaded from {self.config_path}"
+                with open(self.config_path, 'rb') as f:
+                    self.config = _parse_config_file(f)
+                logger.info(
+                    "Configuration loaded from %s", self.config_path
                 )
             except json.JSONDecodeError as e:
-                self.logger.error(
-                    f"Invalid JSON in configuration file: {e}"
+                logger.error(
+                    "Invalid JSON in configuration file: %s", e
                 )
-                self.logger.info("Creating new default configuration...")
+                logger.info("Creating new default configuration...")
                 self.create_default_config()
-                self.config = self.DEFAULT_CONFIG.copy()
+                self.config = copy.deepcopy(_DEFAULT_CONFIG)
             except Exception as e:
-                self.logger.error(
-                    f"Failed to load configuration file: {e}"
+                logger.error(
+                    "Failed to load configuration file: %s", e
                 )
                 raise
         
@@ -239,6 +674,17 @@ class ConfigurationManager:
                 "Please check the error messages above."
             )
         
+        # Build lookups and matchers used on every email
+        self._build_keyword_sets()
+        try:
+            self._compile_matchers()
+        except ValueError as e:
+            logger.error("Configuration validation failed:\n  %s", e)
+            raise ValueError(
+                "Configuration validation failed. "
+                "Please check the error messages above."
+            ) from e
+        
         # Log loaded settings
         self._log_configuration()
         
@@ -255,555 +701,239 @@ class ConfigurationManager:
                 os.makedirs(config_dir, exist_ok=True)
             
             # Write default config with comments
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.DEFAULT_CONFIG, f, indent=2)
+            with open(self.config_path, 'wb') as f:
+                f.write(_json_dumps(_DEFAULT_CONFIG))
             
-            self.logger.info(
-                f"Default configuration file created at {self.config_path}"
+            logger.info(
+                "Default configuration file created at %s", self.config_path
             )
-            self.logger.info(
+            logger.info(
                 "Please review and modify the configuration as needed."
             )
         except Exception as e:
-            self.logger.error(
-                f"Failed to create default configuration file: {e}"
+            logger.error(
+                "Failed to create default configuration file: %s", e
             )
             raise
     
-    def validate_config(self, config: Dict[str, Any]) -> bool:
+    def validate_config(
+        self,
+        config: Dict[str, Any],
+        fail_fast: bool = False
+    ) -> bool:
         """
         Validate configuration structure and values.
         
         Args:
             config: Configuration dictionary to validate
+            fail_fast: Stop at the first error instead of collecting all of
+                them, for callers that only need the result
             
         Returns:
             True if valid, False otherwise
         """
-        is_valid = True
-        
-        # Check required top-level keys
-        required_keys = [
-            "incremental_processing",
-            "input_output",
-            "processing",
-            "logging",
-            "normalization",
-            "position_levels",
-            "work_mode_keywords",
-            "experience_types",
-            "salary_parsing",
-            "experience_parsing",
-            "deadline_parsing"
-        ]
-        
-        for key in required_keys:
-            if key not in config:
-                self.logger.error(
-                    f"Missing required configuration section: '{key}'"
+        errors = _validate_schema(config, fail_fast)
+        
+        # One aggregated record instead of one per violation
+        if errors:
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(
+                    "Configuration validation failed:\n  %s",
+                    "\n  ".join(errors)
                 )
-                is_valid = False
-        
-        if not is_valid:
             return False
         
-        # Validate incremental_processing section
-        is_valid &= self._validate_incremental_processing(
-            config.get("incremental_processing", {})
-        )
-        
-        # Validate input_output section
-        is_valid &= self._validate_input_output(
-            config.get("input_output", {})
-        )
-        
-        # Validate processing section
-        is_valid &= self._validate_processing(
-            config.get("processing", {})
-        )
-        
-        # Validate logging section
-        is_valid &= self._validate_logging(
-            config.get("logging", {})
-        )
-        
-        # Validate normalization section
-        is_valid &= self._validate_normalization(
-            config.get("normalization", {})
-        )
-        
-        # Validate position_levels section
-        is_valid &= self._validate_position_levels(
-            config.get("position_levels", {})
-        )
-        
-        # Validate work_mode_keywords section
-        is_valid &= self._validate_work_mode_keywords(
-            config.get("work_mode_keywords", {})
-        )
+        self._check_input_file(config["input_output"])
         
-        # Validate experience_types section
-        is_valid &= self._validate_experience_types(
-            config.get("experience_types", {})
-        )
-        
-        # Validate salary_parsing section
-        is_valid &= self._validate_salary_parsing(
-            config.get("salary_parsing", {})
-        )
-        
-        # Validate experience_parsing section
-        is_valid &= self._validate_experience_parsing(
-            config.get("experience_parsing", {})
-        )
-        
-        # Validate deadline_parsing section
-        is_valid &= self._validate_deadline_parsing(
-            config.get("deadline_parsing", {})
-        )
-        
-        return is_valid
+        return True
     
-    def _validate_incremental_processing(
-        self,
-        section: Dict[str, Any]
-    ) -> bool:
-        """Validate incremental_processing configuration section."""
-        is_valid = True
-        
-        # Check required fields
-        required_fields = {
-            "enabled": bool,
-            "state_directory": str,
-            "state_file": str,
-            "checkpoint_interval": int,
-            "force_full_reprocess": bool
-        }
-        
-        for field, expected_type in required_fields.items():
-            if field not in section:
-                self.logger.error(
-                    f"Missing required field in incremental_processing: "
-                    f"'{field}'"
-                )
-                is_valid = False
-            elif not isinstance(section[field], expected_type):
-                self.logger.error(
-                    f"Invalid type for incremental_processing.{field}: "
-                    f"expected {expected_type.__name__}, "
-                    f"got {type(section[field]).__name__}"
-                )
-                is_valid = False
-        
-        # Validate checkpoint_interval value
-        if "checkpoint_interval" in section:
-            interval = section["checkpoint_interval"]
-            if not isinstance(interval, int) or interval <= 0:
-                self.logger.error(
-                    f"checkpoint_interval must be a positive integer, "
-                    f"got {interval}"
-                )
-                is_valid = False
-        
-        return is_valid
+    def _check_input_file(self, section: Dict[str, Any]) -> None:
+        """Warn if the configured input file does not exist yet."""
+        if not isinstance(section.get("input_file"), str):
+            return
+        
+        input_path = section["input_file"]
+        # Convert relative path to absolute based on Phase 3 directory
+        if not os.path.isabs(input_path):
+            phase3_dir = os.path.dirname(os.path.abspath(__file__))
+            input_path = os.path.join(phase3_dir, input_path)
+        
+        if not os.path.exists(input_path):
+            logger.warning(
+                "Input file does not exist: %s", section['input_file']
+            )
+            logger.warning(
+                "Processing will fail if this file is not available."
+            )
+            # Don't mark as invalid - file might be created later
     
-    def _validate_input_output(self, section: Dict[str, Any]) -> bool:
-        """Validate input_output configuration section."""
-        is_valid = True
+    def _build_keyword_sets(self) -> None:
+        """
+        Lowercase every keyword list once into a frozenset.
         
-        # Check required fields
-        required_fields = {
-            "input_file": str,
-            "output_csv": str,
-            "output_json": str
+        Downstream checks become O(1) membership tests on lowercased
+        tokens instead of lowercasing and scanning each list per email.
+        """
+        keyword_sections = {
+            "position_levels": self.config.get("position_levels", {}),
+            "work_mode_keywords": self.config.get("work_mode_keywords", {}),
+            "experience_types": {
+                "fresher_keywords": self.config.get(
+                    "experience_types", {}
+                ).get("fresher_keywords", [])
+            }
         }
-        
-        for field, expected_type in required_fields.items():
-            if field not in section:
-                self.logger.error(
-                    f"Missing required field in input_output: '{field}'"
-                )
-                is_valid = False
-            elif not isinstance(section[field], expected_type):
-                self.logger.error(
-                    f"Invalid type for input_output.{field}: "
-                    f"expected {expected_type.__name__}, "
-                    f"got {type(section[field]).__name__}"
-                )
-                is_valid = False
-        
-        # Validate input file exists
-        if "input_file" in section:
-            input_path = section["input_file"]
-            # Convert relative path to absolute based on Phase 3 directory
-            if not os.path.isabs(input_path):
-                phase3_dir = os.path.dirname(os.path.abspath(__file__))
-                input_path = os.path.join(phase3_dir, input_path)
-            
-            if not os.path.exists(input_path):
-                self.logger.warning(
-                    f"Input file does not exist: {section['input_file']}"
-                )
-                self.logger.warning(
-                    "Processing will fail if this file is not available."
-                )
-                # Don't mark as invalid - file might be created later
-        
-        return is_valid
-    
-    def _validate_processing(self, section: Dict[str, Any]) -> bool:
-        """Validate processing configuration section."""
-        is_valid = True
-        
-        # Check required fields
-        required_fields = {
-            "max_jobs_per_email": int,
-            "min_completeness_score": (int, float),
-            "enable_analytics": bool,
-            "max_companies_per_email": int,
-            "max_positions_per_email": int
+        self.keyword_sets = {
+            name: frozenset(keyword.lower() for keyword in keywords)
+            for section in keyword_sections.values()
+            for name, keywords in section.items()
         }
-        
-        for field, expected_type in required_fields.items():
-            if field not in section:
-                self.logger.error(
-                    f"Missing required field in processing: '{field}'"
-                )
-                is_valid = False
-            elif not isinstance(section[field], expected_type):
-                type_name = (
-                    expected_type.__name__ 
-                    if not isinstance(expected_type, tuple)
-                    else " or ".join(t.__name__ for t in expected_type)
-                )
-                self.logger.error(
-                    f"Invalid type for processing.{field}: "
-                    f"expected {type_name}, "
-                    f"got {type(section[field]).__name__}"
-                )
-                is_valid = False
-        
-        # Validate max_jobs_per_email value
-        if "max_jobs_per_email" in section:
-            max_jobs = section["max_jobs_per_email"]
-            if not isinstance(max_jobs, int) or max_jobs <= 0:
-                self.logger.error(
-                    f"max_jobs_per_email must be a positive integer, "
-                    f"got {max_jobs}"
-                )
-                is_valid = False
-        
-        # Validate min_completeness_score value
-        if "min_completeness_score" in section:
-            min_score = section["min_completeness_score"]
-            if not isinstance(min_score, (int, float)) or \
-               not (0.0 <= min_score <= 1.0):
-                self.logger.error(
-                    f"min_completeness_score must be between 0.0 and 1.0, "
-                    f"got {min_score}"
-                )
-                is_valid = False
-        
-        # Validate max_companies_per_email value
-        if "max_companies_per_email" in section:
-            max_companies = section["max_companies_per_email"]
-            if not isinstance(max_companies, int) or max_companies <= 0:
-                self.logger.error(
-                    f"max_companies_per_email must be a positive integer, "
-                    f"got {max_companies}"
-                )
-                is_valid = False
-        
-        # Validate max_positions_per_email value
-        if "max_positions_per_email" in section:
-            max_positions = section["max_positions_per_email"]
-            if not isinstance(max_positions, int) or max_positions <= 0:
-                self.logger.error(
-                    f"max_positions_per_email must be a positive integer, "
-                    f"got {max_positions}"
-                )
-                is_valid = False
-        
-        return is_valid
     
-    def _validate_logging(self, section: Dict[str, Any]) -> bool:
-        """Validate logging configuration section."""
-        is_valid = True
-        
-        # Check required fields
-        required_fields = {
-            "level": str,
-            "file": str,
-            "enable_performance_metrics": bool
-        }
-        
-        for field, expected_type in required_fields.items():
-            if field not in section:
-                self.logger.error(
-                    f"Missing required field in logging: '{field}'"
-                )
-                is_valid = False
-            elif not isinstance(section[field], expected_type):
-                self.logger.error(
-                    f"Invalid type for logging.{field}: "
-                    f"expected {expected_type.__name__}, "
-                    f"got {type(section[field]).__name__}"
-                )
-                is_valid = False
-        
-        # Validate log level
-        if "level" in section:
-            valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-            level = section["level"].upper()
-            if level not in valid_levels:
-                self.logger.error(
-                    f"Invalid log level: {section['level']}. "
-                    f"Must be one of: {', '.join(valid_levels)}"
-                )
-                is_valid = False
-        
-        return is_valid
-    
-    def _validate_normalization(self, section: Dict[str, Any]) -> bool:
-        """Validate normalization configuration section."""
-        is_valid = True
-        
-        # Check required fields
-        required_fields = {
-            "skill_map": dict,
-            "degree_map": dict,
-            "city_map": dict,
-            "company_suffixes": list
-        }
-        
-        for field, expected_type in required_fields.items():
-            if field not in section:
-                self.logger.error(
-                    f"Missing required field in normalization: '{field}'"
-                )
-                is_valid = False
-            elif not isinstance(section[field], expected_type):
-                self.logger.error(
-                    f"Invalid type for normalization.{field}: "
-                    f"expected {expected_type.__name__}, "
-                    f"got {type(section[field]).__name__}"
-                )
-                is_valid = False
-        
-        return is_valid
-    
-    def _validate_position_levels(self, section: Dict[str, Any]) -> bool:
-        """Validate position_levels configuration section."""
-        is_valid = True
-        
-        # Check required fields
-        required_fields = {
-            "senior_keywords": list,
-            "junior_keywords": list,
-            "intern_keywords": list,
-            "manager_keywords": list
-        }
+    def _compile_matchers(self) -> None:
+        """
+        Precompile the lookups and patterns used on every email.
         
-        for field, expected_type in required_fields.items():
-            if field not in section:
-                self.logger.error(
-                    f"Missing required field in position_levels: '{field}'"
-                )
-                is_valid = False
-            elif not isinstance(section[field], expected_type):
-                self.logger.error(
-                    f"Invalid type for position_levels.{field}: "
-                    f"expected {expected_type.__name__}, "
-                    f"got {type(section[field]).__name__}"
-                )
-                is_valid = False
+        Normalization maps get lowercased keys, company suffixes become one
+        end-anchored regex, and parsing patterns are compiled once instead of
+        per email.
         
-        return is_valid
-    
-    def _validate_work_mode_keywords(self, section: Dict[str, Any]) -> bool:
-        """Validate work_mode_keywords configuration section."""
-        is_valid = True
-        
-        # Check required fields
-        required_fields = {
-            "remote": list,
-            "hybrid": list
-        }
+        Raises:
+            ValueError: If a configured pattern is not a valid regex
+        """
+        compiled: Dict[str, Any] = {}
         
-        for field, expected_type in required_fields.items():
-            if field not in section:
-                self.logger.error(
-                    f"Missing required field in work_mode_keywords: '{field}'"
-                )
-                is_valid = False
-            elif not isinstance(section[field], expected_type):
-                self.logger.error(
-                    f"Invalid type for work_mode_keywords.{field}: "
-                    f"expected {expected_type.__name__}, "
-                    f"got {type(section[field]).__name__}"
-                )
-                is_valid = False
+        # Normalization maps, keyed by lowercased term
+        norm_config = self.config.get("normalization", {})
+        for map_name in ("skill_map", "degree_map", "city_map"):
+            compiled[map_name] = {
+                key.lower(): value
+                for key, value in norm_config.get(map_name, {}).items()
+            }
         
-        return is_valid
-    
-    def _validate_experience_types(self, section: Dict[str, Any]) -> bool:
-        """Validate experience_types configuration section."""
-        is_valid = True
+        # Company suffixes are only stripped at the end of a name
+        compiled["company_suffix_regex"] = _compile_alternation(
+            norm_config.get("company_suffixes", []),
+            prefix=r"[\s,]*",
+            suffix=r"\.?\s*$"
+        )
         
-        # Check required fields
-        if "fresher_keywords" not in section:
-            self.logger.error(
-                "Missing required field in experience_types: 'fresher_keywords'"
+        # Parsing patterns, compiled once instead of per email
+        salary_patterns = [
+            (
+                pattern_config["name"],
+                _compile_pattern(
+                    f"salary_parsing.patterns[{idx}]",
+                    pattern_config["pattern"],
+                    re.IGNORECASE
+                ),
+                pattern_config["confidence"]
             )
-            is_valid = False
-        elif not isinstance(section["fresher_keywords"], list):
-            self.logger.error(
-                "Invalid type for experience_types.fresher_keywords: "
-                f"expected list, got {type(section['fresher_keywords']).__name__}"
+            for idx, pattern_config in enumerate(
+                self.config.get("salary_parsing", {}).get("patterns", [])
             )
-            is_valid = False
-        
-        if "thresholds" not in section:
-            self.logger.error(
-                "Missing required field in experience_types: 'thresholds'"
+        ]
+        compiled["salary_patterns"] = salary_patterns
+        compiled["experience_patterns"] = [
+            _compile_pattern(
+                f"experience_parsing.patterns[{idx}]", pattern, re.IGNORECASE
             )
-            is_valid = False
-        elif not isinstance(section["thresholds"], dict):
-            self.logger.error(
-                "Invalid type for experience_types.thresholds: "
-                f"expected dict, got {type(section['thresholds']).__name__}"
+            for idx, pattern in enumerate(
+                self.config.get("experience_parsing", {}).get("patterns", [])
             )
-            is_valid = False
-        else:
-            # Validate threshold values
-            thresholds = section["thresholds"]
-            for key in ["entry_level_max", "mid_level_max"]:
-                if key not in thresholds:
-                    self.logger.error(
-                        f"Missing required field in experience_types.thresholds: '{key}'"
-                    )
-                    is_valid = False
-                elif not isinstance(thresholds[key], int):
-                    self.logger.error(
-                        f"Invalid type for experience_types.thresholds.{key}: "
-                        f"expected int, got {type(thresholds[key]).__name__}"
-                    )
-                    is_valid = False
-        
-        return is_valid
-    
-    def _validate_salary_parsing(self, section: Dict[str, Any]) -> bool:
-        """Validate salary_parsing configuration section."""
-        is_valid = True
-        
-        # Check required fields
-        if "patterns" not in section:
-            self.logger.error(
-                "Missing required field in salary_parsing: 'patterns'"
+        ]
+        compiled["date_patterns"] = [
+            (
+                _compile_pattern(
+                    f"deadline_parsing.date_patterns[{idx}]",
+                    pattern_config["pattern"]
+                ),
+                pattern_config["format"]
             )
-            is_valid = False
-        elif not isinstance(section["patterns"], list):
-            self.logger.error(
-                "Invalid type for salary_parsing.patterns: "
-                f"expected list, got {type(section['patterns']).__name__}"
+            for idx, pattern_config in enumerate(
+                self.config.get("deadline_parsing", {}).get("date_patterns", [])
             )
-            is_valid = False
-        else:
-            # Validate each pattern
-            for idx, pattern in enumerate(section["patterns"]):
-                if not isinstance(pattern, dict):
-                    self.logger.error(
-                        f"Invalid pattern at index {idx}: expected dict"
-                    )
-                    is_valid = False
-                    continue
-                
-                for key in ["name", "pattern", "confidence"]:
-                    if key not in pattern:
-                        self.logger.error(
-                            f"Missing required field in pattern {idx}: '{key}'"
-                        )
-                        is_valid = False
-        
-        if "default_currency" not in section:
-            self.logger.error(
-                "Missing required field in salary_parsing: 'default_currency'"
-            )
-            is_valid = False
+        ]
         
-        if "default_period" not in section:
-            self.logger.error(
-                "Missing required field in salary_parsing: 'default_period'"
+        # All salary patterns fused into one regex so the text is scanned
+        # once; each pattern is wrapped in a named group "p<index>". That
+        # renumbers groups, so patterns referring to a group by number are
+        # matched one by one instead
+        if any(
+            _NUMBERED_GROUP_REF.search(regex.pattern)
+            for _, regex, _ in salary_patterns
+        ):
+            logger.info(
+                "Salary patterns use numbered group references, "
+                "matching one by one"
             )
-            is_valid = False
+            compiled["salary_regex"] = None
+        else:
+            try:
+                compiled["salary_regex"] = re.compile(
+                    "|".join(
+                        f"(?P<p{idx}>{regex.pattern})"
+                        for idx, (_, regex, _) in enumerate(salary_patterns)
+                    ) or r"(?!)",
+                    re.IGNORECASE
+                )
+            except re.error as e:
+                # e.g. patterns using inline flags or clashing group names
+                logger.warning(
+                    "Could not fuse salary patterns, matching one by one: %s", e
+                )
+                compiled["salary_regex"] = None
         
-        return is_valid
+        self.compiled = compiled
     
-    def _validate_experience_parsing(self, section: Dict[str, Any]) -> bool:
-        """Validate experience_parsing configuration section."""
-        is_valid = True
+    def match_salary(
+        self, text: str
+    ) -> Optional[Tuple[str, str, Tuple, float]]:
+        """
+        Find a salary mention in text, preferring patterns in config order.
         
-        # Check required fields
-        if "patterns" not in section:
-            self.logger.error(
-                "Missing required field in experience_parsing: 'patterns'"
-            )
-            is_valid = False
-        elif not isinstance(section["patterns"], list):
-            self.logger.error(
-                "Invalid type for experience_parsing.patterns: "
-                f"expected list, got {type(section['patterns']).__name__}"
-            )
-            is_valid = False
+        The first configured pattern that matches anywhere in the text wins,
+        as if each pattern were tried in turn. The fused salary regex finds
+        the leftmost match in one scan; only patterns listed before the one
+        it found need a further search, and only after that position.
         
-        return is_valid
+        Args:
+            text: Text to search
+            
+        Returns:
+            (pattern name, matched text, captured groups, confidence) or
+            None if no match
+        """
+        patterns = self.compiled["salary_patterns"]
+        regex = self.compiled["salary_regex"]
+        if regex is None:
+            return self._match_salary_sequential(text)
+        
+        match = regex.search(text)
+        if match is None:
+            return None
+        
+        # Earlier patterns failed at and before this position, but may
+        # still match further on
+        idx = int(match.lastgroup[1:])
+        for name, pattern, confidence in patterns[:idx]:
+            earlier = pattern.search(text, match.start() + 1)
+            if earlier:
+                return name, earlier.group(0), earlier.groups(), confidence
+        
+        name, pattern, confidence = patterns[idx]
+        start = regex.groupindex[match.lastgroup]
+        groups = match.groups()[start:start + pattern.groups]
+        return name, match.group(0), groups, confidence
     
-    def _validate_deadline_parsing(self, section: Dict[str, Any]) -> bool:
-        """Validate deadline_parsing configuration section."""
-        is_valid = True
-        
-        # Check required fields
-        if "date_patterns" not in section:
-            self.logger.error(
-                "Missing required field in deadline_parsing: 'date_patterns'"
-            )
-            is_valid = False
-        elif not isinstance(section["date_patterns"], list):
-            self.logger.error(
-                "Invalid type for deadline_parsing.date_patterns: "
-                f"expected list, got {type(section['date_patterns']).__name__}"
-            )
-            is_valid = False
-        else:
-            # Validate each date pattern
-            for idx, pattern in enumerate(section["date_patterns"]):
-                if not isinstance(pattern, dict):
-                    self.logger.error(
-                        f"Invalid date pattern at index {idx}: expected dict"
-                    )
-                    is_valid = False
-                    continue
-                
-                for key in ["pattern", "format"]:
-                    if key not in pattern:
-                        self.logger.error(
-                            f"Missing required field in date pattern {idx}: '{key}'"
-                        )
-                        is_valid = False
-        
-        if "relative_keywords" not in section:
-            self.logger.error(
-                "Missing required field in deadline_parsing: 'relative_keywords'"
-            )
-            is_valid = False
-        elif not isinstance(section["relative_keywords"], dict):
-            self.logger.error(
-                "Invalid type for deadline_parsing.relative_keywords: "
-                f"expected dict, got {type(section['relative_keywords']).__name__}"
-            )
-            is_valid = False
-        
-        return is_valid
+    def _match_salary_sequential(
+        self, text: str
+    ) -> Optional[Tuple[str, str, Tuple, float]]:
+        """Try each salary pattern in config order; used when fusing fails."""
+        for name, pattern, confidence in self.compiled["salary_patterns"]:
+            match = pattern.search(text)
+            if match:
+                return name, match.group(0), match.groups(), confidence
+        return None
     
     def get_setting(self, key: str, default: Any = None) -> Any:
         """
@@ -816,135 +946,85 @@ class ConfigurationManager:
         Returns:
             Configuration value or default
         """
-        keys = key.split('.')
+        # Walk the live config so changes made after loading are seen
         value = self.config
-        
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            self.logger.debug(
-                f"Configuration key '{key}' not found, using default: {default}"
+        for k in _split_key(key):
+            if not isinstance(value, dict):
+                value = _MISSING
+                break
+            value = value.get(k, _MISSING)
+            if value is _MISSING:
+                break
+        
+        if value is _MISSING:
+            logger.debug(
+                "Configuration key '%s' not found, using default: %s",
+                key, default
             )
             return default
+        return value
     
     def _log_configuration(self) -> None:
         """Log loaded configuration settings for confirmation."""
-        self.logger.info("=" * 70)
-        self.logger.info("CONFIGURATION LOADED")
-        self.logger.info("=" * 70)
+        # Skip building the summary entirely when INFO is filtered out
+        if not logger.isEnabledFor(logging.INFO):
+            return
         
-        # Incremental processing settings
         inc_proc = self.config.get("incremental_processing", {})
-        self.logger.info("Incremental Processing:")
-        self.logger.info(f"  Enabled: {inc_proc.get('enabled')}")
-        self.logger.info(
-            f"  State Directory: {inc_proc.get('state_directory')}"
-        )
-        self.logger.info(f"  State File: {inc_proc.get('state_file')}")
-        self.logger.info(
-            f"  Checkpoint Interval: {inc_proc.get('checkpoint_interval')}"
-        )
-        self.logger.info(
-            f"  Force Full Reprocess: {inc_proc.get('force_full_reprocess')}"
-        )
-        
-        # Input/Output settings
         io_config = self.config.get("input_output", {})
-        self.logger.info("Input/Output:")
-        self.logger.info(f"  Input File: {io_config.get('input_file')}")
-        self.logger.info(f"  Output CSV: {io_config.get('output_csv')}")
-        self.logger.info(f"  Output JSON: {io_config.get('output_json')}")
-        
-        # Processing settings
         proc_config = self.config.get("processing", {})
-        self.logger.info("Processing:")
-        self.logger.info(
-            f"  Max Jobs Per Email: {proc_config.get('max_jobs_per_email')}"
-        )
-        self.logger.info(
-            f"  Max Companies Per Email: {proc_config.get('max_companies_per_email')}"
-        )
-        self.logger.info(
-            f"  Max Positions Per Email: {proc_config.get('max_positions_per_email')}"
-        )
-        self.logger.info(
-            f"  Min Completeness Score: "
-            f"{proc_config.get('min_completeness_score')}"
-        )
-        self.logger.info(
-            f"  Enable Analytics: {proc_config.get('enable_analytics')}"
-        )
-        
-        # Logging settings
         log_config = self.config.get("logging", {})
-        self.logger.info("Logging:")
-        self.logger.info(f"  Level: {log_config.get('level')}")
-        self.logger.info(f"  File: {log_config.get('file')}")
-        self.logger.info(
-            f"  Performance Metrics: "
-            f"{log_config.get('enable_performance_metrics')}"
-        )
-        
-        # Normalization settings
         norm_config = self.config.get("normalization", {})
-        self.logger.info("Normalization:")
-        self.logger.info(
-            f"  Skill mappings: {len(norm_config.get('skill_map', {}))}"
-        )
-        self.logger.info(
-            f"  Degree mappings: {len(norm_config.get('degree_map', {}))}"
-        )
-        self.logger.info(
-            f"  City mappings: {len(norm_config.get('city_map', {}))}"
-        )
-        self.logger.info(
-            f"  Company suffixes: {len(norm_config.get('company_suffixes', []))}"
-        )
-        
-        # Position levels
         pos_config = self.config.get("position_levels", {})
-        self.logger.info("Position Levels:")
-        self.logger.info(
-            f"  Senior keywords: {len(pos_config.get('senior_keywords', []))}"
-        )
-        self.logger.info(
-            f"  Junior keywords: {len(pos_config.get('junior_keywords', []))}"
-        )
-        self.logger.info(
-            f"  Intern keywords: {len(pos_config.get('intern_keywords', []))}"
-        )
-        self.logger.info(
-            f"  Manager keywords: {len(pos_config.get('manager_keywords', []))}"
-        )
-        
-        # Salary parsing
         salary_config = self.config.get("salary_parsing", {})
-        self.logger.info("Salary Parsing:")
-        self.logger.info(
-            f"  Patterns: {len(salary_config.get('patterns', []))}"
-        )
-        self.logger.info(
-            f"  Default currency: {salary_config.get('default_currency')}"
-        )
-        
-        # Experience parsing
         exp_config = self.config.get("experience_parsing", {})
-        self.logger.info("Experience Parsing:")
-        self.logger.info(
-            f"  Patterns: {len(exp_config.get('patterns', []))}"
-        )
-        
-        # Deadline parsing
         deadline_config = self.config.get("deadline_parsing", {})
-        self.logger.info("Deadline Parsing:")
-        self.logger.info(
-            f"  Date patterns: {len(deadline_config.get('date_patterns', []))}"
-        )
         
-        self.logger.info("=" * 70)
-
+        # One record instead of a handler dispatch per line
+        lines = [
+            "=" * 70,
+            "CONFIGURATION LOADED",
+            "=" * 70,
+            "Incremental Processing:",
+            f"  Enabled: {inc_proc.get('enabled')}",
+            f"  State Directory: {inc_proc.get('state_directory')}",
+            f"  State File: {inc_proc.get('state_file')}",
+            f"  Checkpoint Interval: {inc_proc.get('checkpoint_interval')}",
+            f"  Force Full Reprocess: {inc_proc.get('force_full_reprocess')}",
+            "Input/Output:",
+            f"  Input File: {io_config.get('input_file')}",
+            f"  Output CSV: {io_config.get('output_csv')}",
+            f"  Output JSON: {io_config.get('output_json')}",
+            "Processing:",
+            f"  Max Jobs Per Email: {proc_config.get('max_jobs_per_email')}",
+            f"  Max Companies Per Email: {proc_config.get('max_companies_per_email')}",
+            f"  Max Positions Per Email: {proc_config.get('max_positions_per_email')}",
+            f"  Min Completeness Score: {proc_config.get('min_completeness_score')}",
+            f"  Enable Analytics: {proc_config.get('enable_analytics')}",
+            "Logging:",
+            f"  Level: {log_config.get('level')}",
+            f"  File: {log_config.get('file')}",
+            f"  Performance Metrics: {log_config.get('enable_performance_metrics')}",
+            "Normalization:",
+            f"  Skill mappings: {len(norm_config.get('skill_map', {}))}",
+            f"  Degree mappings: {len(norm_config.get('degree_map', {}))}",
+            f"  City mappings: {len(norm_config.get('city_map', {}))}",
+            f"  Company suffixes: {len(norm_config.get('company_suffixes', []))}",
+            "Position Levels:",
+            f"  Senior keywords: {len(pos_config.get('senior_keywords', []))}",
+            f"  Junior keywords: {len(pos_config.get('junior_keywords', []))}",
+            f"  Intern keywords: {len(pos_config.get('intern_keywords', []))}",
+            f"  Manager keywords: {len(pos_config.get('manager_keywords', []))}",
+            "Salary Parsing:",
+            f"  Patterns: {len(salary_config.get('patterns', []))}",
+            f"  Default currency: {salary_config.get('default_currency')}",
+            "Experience Parsing:",
+            f"  Patterns: {len(exp_config.get('patterns', []))}",
+            "Deadline Parsing:",
+            f"  Date patterns: {len(deadline_config.get('date_patterns', []))}",
+            "=" * 70
+        ]
+        logger.info("\n".join(lines))
 
 def create_example_config(output_path: str = "config.example.json") -> None:
     """
@@ -953,68 +1033,9 @@ def create_example_config(output_path: str = "config.example.json") -> None:
     Args:
         output_path: Path where to save the example config
     """
-    example_config = {
-        "_comment": "Phase 3 Entity Structuring Configuration",
-        "_description": "This file controls all Phase 3 processing behavior",
-        
-        "incremental_processing": {
-            "_comment": "Incremental processing settings",
-            "enabled": True,
-            "_enabled_description": "Enable incremental processing (only process new emails)",
-            
-            "state_directory": "state",
-            "_state_directory_description": "Directory to store state files",
-            
-            "state_file": "processed_message_ids.txt",
-            "_state_file_description": "File name for tracking processed email IDs",
-            
-            "checkpoint_interval": 50,
-            "_checkpoint_interval_description": "Save checkpoint every N emails for crash recovery",
-            
-            "force_full_reprocess": False,
-            "_force_full_reprocess_description": "Set to true to reprocess all emails (ignores state)"
-        },
-        
-        "input_output": {
-            "_comment": "Input and output file paths",
-            "input_file": "../Phase 2/relevant_placement_emails.csv",
-            "_input_file_description": "Path to Phase 2 output CSV (relative to Phase 3 directory)",
-            
-            "output_csv": "structured_job_postings.csv",
-            "_output_csv_description": "Output CSV file name",
-            
-            "output_json": "structured_job_postings.json",
-            "_output_json_description": "Output JSON file name"
-        },
-        
-        "processing": {
-            "_comment": "Processing parameters",
-            "max_jobs_per_email": 5,
-            "_max_jobs_per_email_description": "Maximum job postings to extract per email",
-            
-            "min_completeness_score": 0.3,
-            "_min_completeness_score_description": "Minimum completeness score (0.0-1.0) to include job",
-            
-            "enable_analytics": True,
-            "_enable_analytics_description": "Generate analytics report after processing"
-        },
-        
-        "logging": {
-            "_comment": "Logging configuration",
-            "level": "INFO",
-            "_level_description": "Log level: DEBUG, INFO, WARNING, ERROR, CRITICAL",
-            
-            "file": "entity_structuring.log",
-            "_file_description": "Log file name",
-            
-            "enable_performance_metrics": True,
-            "_enable_performance_metrics_description": "Log performance metrics and timing"
-        }
-    }
-    
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(example_config, f, indent=2)
+        with open(output_path, 'wb') as f:
+            f.write(_json_dumps(_EXAMPLE_CONFIG))
         print(f"Example configuration created at {output_path}")
     except Exception as e:
         print(f"Failed to create example configuration: {e}")
@@ -4,30 +4,255 @@ Loads settings from config.json and creates UserProfile and PrioritizationWeight
 """
 
 import json
+import mmap
 import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, FrozenSet, Iterable, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
+# orjson parses config files several times faster when installed
+try:
+    import orjson
+    
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+    
+    # orjson parses memoryviews, so large files can be parsed from an mmap
+    _JSON_PARSES_BUFFERS = True
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+    
+    _JSON_PARSES_BUFFERS = False
+
+# Config files larger than this are parsed from an mmap instead of being
+# copied into a bytes object first
+_MMAP_THRESHOLD = 1 << 20
+
+# Parsed configs kept in memory, and values derived from each of them
+_CONFIG_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=_CONFIG_CACHE_SIZE)
+def _load_config_cached(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a config file once per (absolute path, mtime) pair.
+    
+    The mtime is only part of the cache key, so editing the file
+    invalidates the cached entry on the next load.
+    """
+    with open(config_path, 'rb') as f:
+        if (
+            _JSON_PARSES_BUFFERS
+            and os.fstat(f.fileno()).st_size > _MMAP_THRESHOLD
+        ):
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return _json_loads(view)
+        return _json_loads(f.read())
+
 
 def load_config(config_path: str = "config.json") -> Dict[str, Any]:
     """
     Load configuration from JSON file.
     
+    Repeated loads of an unchanged file return the same cached dictionary,
+    so callers should treat it as read-only.
+    
     Args:
         config_path: Path to config.json file
         
     Returns:
         Dictionary containing configuration
     """
-    if not os.path.exists(config_path):
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+    try:
+        mtime_ns = os.stat(config_path).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+    
+    return _load_config_cached(os.path.abspath(config_path), mtime_ns)
+
+
+def load_configs(config_paths: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Load several config files concurrently.
+    
+    File reads overlap across threads, so startup takes roughly as long as
+    the slowest file instead of the sum of all of them.
+    
+    Args:
+        config_paths: Paths to config files
+        
+    Returns:
+        Dictionary mapping each path to its configuration
+    """
+    paths = list(dict.fromkeys(config_paths))
+    if len(paths) <= 1:
+        return {path: load_config(path) for path in paths}
+    
+    with ThreadPoolExecutor(max_workers=min(4, len(paths))) as executor:
+        return dict(zip(paths, executor.map(load_config, paths)))
+
+
+def _lowercase_set(names) -> FrozenSet[str]:
+    """
+    Lowercase a list of names into a frozenset for O(1) membership tests.
+    
+    Names are interned so lookups with an interned key can short-circuit
+    on identity before comparing characters.
+    """
+    return frozenset(sys.intern(name.lower()) for name in names)
+
+
+@dataclass(frozen=True, slots=True)
+class ScoringContext:
+    """
+    Lowercased company and city sets used by the scoring loop.
+    
+    Built once per loaded config so scorers never re-lowercase the lists.
+    """
+    faang_companies: FrozenSet[str]
+    unicorn_companies: FrozenSet[str]
+    mnc_companies: FrozenSet[str]
+    tier1_cities: FrozenSet[str]
+    tier2_cities: FrozenSet[str]
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'ScoringContext':
+        rep_config = config.get('company_reputation', {})
+        loc_config = config.get('location_scoring', {})
+        return cls(
+            faang_companies=_lowercase_set(rep_config.get('faang_companies', [])),
+            unicorn_companies=_lowercase_set(rep_config.get('unicorn_companies', [])),
+            mnc_companies=_lowercase_set(rep_config.get('mnc_companies', [])),
+            tier1_cities=_lowercase_set(loc_config.get('tier1_cities', [])),
+            tier2_cities=_lowercase_set(loc_config.get('tier2_cities', []))
+        )
+
+
+# id(config) -> (config, {name: value}) for immutable values derived from a
+# loaded config, least recently used first; the config is kept alive so its
+# id cannot be reused by another dict while the entry exists
+_DERIVED: "OrderedDict[int, Tuple[Dict[str, Any], Dict[str, Any]]]" = OrderedDict()
+
+
+def _derived(config: Dict[str, Any], name: str, build) -> Any:
+    """Return build(config), computed once per config object and name."""
+    entry = _DERIVED.get(id(config))
+    if entry is None or entry[0] is not config:
+        entry = (config, {})
+        _DERIVED[id(config)] = entry
+        # Hold no more configs alive than _load_config_cached does
+        while len(_DERIVED) > _CONFIG_CACHE_SIZE:
+            _DERIVED.popitem(last=False)
+    else:
+        _DERIVED.move_to_end(id(config))
+    values = entry[1]
+    if name not in values:
+        values[name] = build(config)
+    return values[name]
+
+
+def get_scoring_context(config: Dict[str, Any]) -> ScoringContext:
+    """
+    Get the ScoringContext for a config, building it on first use.
     
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = json.load(f)
+    Args:
+        config: Configuration dictionary (as returned by load_config)
+        
+    Returns:
+        ScoringContext with precomputed lowercase sets
+    """
+    return _derived(config, 'scoring_context', ScoringContext.from_config)
+
+
+class _ConfigStruct:
+    """
+    Mixin letting config structs also be read like the dicts they replace,
+    e.g. paths['output_csv'] as well as paths.output_csv.
+    """
+    __slots__ = ()
     
-    return config
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
+@dataclass(frozen=True, slots=True)
+class InputOutputPaths(_ConfigStruct):
+    input_file: str
+    output_csv: str
+    top_recommendations_csv: str
+    top_n: int
+
+
+@dataclass(frozen=True, slots=True)
+class IncrementalProcessingConfig(_ConfigStruct):
+    enabled: bool
+    state_directory: str
+    state_file: str
+    checkpoint_interval: int
+    force_full_reprocess: bool
+    recalculate_all_priorities: bool
+
+
+@dataclass(frozen=True, slots=True)
+class CompanyReputationConfig(_ConfigStruct):
+    tier_scores: Dict[str, float]
+    faang_companies: FrozenSet[str]
+    unicorn_companies: FrozenSet[str]
+    mnc_companies: FrozenSet[str]
+
+
+@dataclass(frozen=True, slots=True)
+class SkillsScoringConfig(_ConfigStruct):
+    exact_match_bonus: float
+    partial_match_bonus: float
+    skill_categories: Dict[str, Any]
+    min_skills_for_bonus: int
+    multiple_skills_bonus: float
+
+
+@dataclass(frozen=True, slots=True)
+class LocationScoringConfig(_ConfigStruct):
+    exact_match_score: float
+    remote_score: float
+    tier1_cities_score: float
+    tier2_cities_score: float
+    other_cities_score: float
+    tier1_cities: FrozenSet[str]
+    tier2_cities: FrozenSet[str]
+
+
+@dataclass(frozen=True, slots=True)
+class SalaryScoringConfig(_ConfigStruct):
+    ideal_salary_lpa: float
+    min_acceptable_lpa: float
+    max_expected_lpa: float
+    below_min_penalty: float
+    above_max_bonus: float
+    missing_salary_score: float
+
+
+@dataclass(frozen=True, slots=True)
+class DeadlineUrgencyConfig(_ConfigStruct):
+    days_thresholds: Dict[str, int]
+    urgency_scores: Dict[str, float]
+    expired_penalty: float
+
+
+@dataclass(frozen=True, slots=True)
+class LoggingConfig(_ConfigStruct):
+    level: str
+    file: str
+    enable_performance_metrics: bool
 
 
 def create_user_profile_from_config(config: Dict[str, Any]):
@@ -49,8 +274,8 @@ def create_user_profile_from_config(config: Dict[str, Any]):
     user_id = "USER_CONFIG"
     name = "Config User"
     
-    # Skills
-    preferred_skills = user_config.get('preferred_skills', [])
+    # Skills (lists are copied so the profile can't modify the cached config)
+    preferred_skills = list(user_config.get('preferred_skills', []))
     primary_skills = preferred_skills[:5]  # Top 5 as primary
     
     # Education
@@ -62,7 +287,7 @@ def create_user_profile_from_config(config: Dict[str, Any]):
     experience_years = exp_range.get('min', 0)
     
     # Locations
-    preferred_locations = user_config.get('preferred_locations', [])
+    preferred_locations = list(user_config.get('preferred_locations', []))
     
     # Work mode
     preferred_work_modes = user_config.get('preferred_work_modes', [])
@@ -73,7 +298,7 @@ def create_user_profile_from_config(config: Dict[str, Any]):
     max_salary = user_config.get('max_salary_lpa', 50) * 100000
     
     # Avoid keywords
-    avoid_keywords = user_config.get('avoid_keywords', [])
+    avoid_keywords = list(user_config.get('avoid_keywords', []))
     
     return {
         'user_id': user_id,
@@ -118,7 +343,7 @@ def create_weights_from_config(config: Dict[str, Any]):
     }
 
 
-def get_input_output_paths(config: Dict[str, Any]) -> Dict[str, str]:
+def get_input_output_paths(config: Dict[str, Any]) -> InputOutputPaths:
     """
     Get input/output file paths from config.
     
@@ -126,19 +351,19 @@ def get_input_output_paths(config: Dict[str, Any]) -> Dict[str, str]:
         config: Configuration dictionary
         
     Returns:
-        Dictionary with file paths
+        InputOutputPaths with file paths
     """
     io_config = config.get('input_output', {})
     
-    return {
-        'input_file': io_config.get('input_file', '../Phase 3/structured_job_postings.json'),
-        'output_csv': io_config.get('output_csv', 'prioritized_jobs.csv'),
-        'top_recommendations_csv': io_config.get('top_recommendations_csv', 'top_recommendations.csv'),
-        'top_n': io_config.get('top_n_recommendations', 20)
-    }
+    return InputOutputPaths(
+        input_file=io_config.get('input_file', '../Phase 3/structured_job_postings.json'),
+        output_csv=io_config.get('output_csv', 'prioritized_jobs.csv'),
+        top_recommendations_csv=io_config.get('top_recommendations_csv', 'top_recommendations.csv'),
+        top_n=io_config.get('top_n_recommendations', 20)
+    )
 
 
-def get_incremental_processing_config(config: Dict[str, Any]) -> Dict[str, Any]:
+def get_incremental_processing_config(config: Dict[str, Any]) -> IncrementalProcessingConfig:
     """
     Get incremental processing configuration.
     
@@ -150,17 +375,17 @@ def get_incremental_processing_config(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     inc_config = config.get('incremental_processing', {})
     
-    return {
-        'enabled': inc_config.get('enabled', True),
-        'state_directory': inc_config.get('state_directory', 'state'),
-        'state_file': inc_config.get('state_file', 'prioritized_job_ids.txt'),
-        'checkpoint_interval': inc_config.get('checkpoint_interval', 50),
-        'force_full_reprocess': inc_config.get('force_full_reprocess', False),
-        'recalculate_all_priorities': inc_config.get('recalculate_all_priorities', False)
-    }
+    return IncrementalProcessingConfig(
+        enabled=inc_config.get('enabled', True),
+        state_directory=inc_config.get('state_directory', 'state'),
+        state_file=inc_config.get('state_file', 'prioritized_job_ids.txt'),
+        checkpoint_interval=inc_config.get('checkpoint_interval', 50),
+        force_full_reprocess=inc_config.get('force_full_reprocess', False),
+        recalculate_all_priorities=inc_config.get('recalculate_all_priorities', False)
+    )
 
 
-def get_company_reputation_config(config: Dict[str, Any]) -> Dict[str, Any]:
+def get_company_reputation_config(config: Dict[str, Any]) -> CompanyReputationConfig:
     """
     Get company reputation scoring configuration.
     
@@ -171,16 +396,17 @@ def get_company_reputation_config(config: Dict[str, Any]) -> Dict[str, Any]:
         Company reputation settings
     """
     rep_config = config.get('company_reputation', {})
-    
-    return {
-        'tier_scores': rep_config.get('tier_scores', {}),
-        'faang_companies': set(c.lower() for c in rep_config.get('faang_companies', [])),
-        'unicorn_companies': set(c.lower() for c in rep_config.get('unicorn_companies', [])),
-        'mnc_companies': set(c.lower() for c in rep_config.get('mnc_companies', []))
-    }
+    context = get_scoring_context(config)
+    
+    return CompanyReputationConfig(
+        tier_scores=rep_config.get('tier_scores', {}),
+        faang_companies=context.faang_companies,
+        unicorn_companies=context.unicorn_companies,
+        mnc_companies=context.mnc_companies
+    )
 
 
-def get_skills_scoring_config(config: Dict[str, Any]) -> Dict[str, Any]:
+def get_skills_scoring_config(config: Dict[str, Any]) -> SkillsScoringConfig:
     """
     Get skills scoring configuration.
     
@@ -192,16 +418,16 @@ def get_skills_scoring_config(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     skills_config = config.get('skills_scoring', {})
     
-    return {
-        'exact_match_bonus': skills_config.get('exact_match_bonus', 1.0),
-        'partial_match_bonus': skills_config.get('partial_match_bonus', 0.5),
-        'skill_categories': skills_config.get('skill_categories', {}),
-        'min_skills_for_bonus': skills_config.get('min_skills_for_bonus', 3),
-        'multiple_skills_bonus': skills_config.get('multiple_skills_bonus', 0.2)
-    }
+    return SkillsScoringConfig(
+        exact_match_bonus=skills_config.get('exact_match_bonus', 1.0),
+        partial_match_bonus=skills_config.get('partial_match_bonus', 0.5),
+        skill_categories=skills_config.get('skill_categories', {}),
+        min_skills_for_bonus=skills_config.get('min_skills_for_bonus', 3),
+        multiple_skills_bonus=skills_config.get('multiple_skills_bonus', 0.2)
+    )
 
 
-def get_location_scoring_config(config: Dict[str, Any]) -> Dict[str, Any]:
+def get_location_scoring_config(config: Dict[str, Any]) -> LocationScoringConfig:
     """
     Get location scoring configuration.
     
@@ -212,19 +438,20 @@ def get_location_scoring_config(config: Dict[str, Any]) -> Dict[str, Any]:
         Location scoring settings
     """
     loc_config = config.get('location_scoring', {})
-    
-    return {
-        'exact_match_score': loc_config.get('exact_match_score', 1.0),
-        'remote_score': loc_config.get('remote_score', 1.0),
-        'tier1_cities_score': loc_config.get('tier1_cities_score', 0.8),
-        'tier2_cities_score': loc_config.get('tier2_cities_score', 0.6),
-        'other_cities_score': loc_config.get('other_cities_score', 0.4),
-        'tier1_cities': set(c.lower() for c in loc_config.get('tier1_cities', [])),
-        'tier2_cities': set(c.lower() for c in loc_config.get('tier2_cities', []))
-    }
+    context = get_scoring_context(config)
+    
+    return LocationScoringConfig(
+        exact_match_score=loc_config.get('exact_match_score', 1.0),
+        remote_score=loc_config.get('remote_score', 1.0),
+        tier1_cities_score=loc_config.get('tier1_cities_score', 0.8),
+        tier2_cities_score=loc_config.get('tier2_cities_score', 0.6),
+        other_cities_score=loc_config.get('other_cities_score', 0.4),
+        tier1_cities=context.tier1_cities,
+        tier2_cities=context.tier2_cities
+    )
 
 
-def get_salary_scoring_config(config: Dict[str, Any]) -> Dict[str, Any]:
+def get_salary_scoring_config(config: Dict[str, Any]) -> SalaryScoringConfig:
     """
     Get salary scoring configuration.
     
@@ -236,17 +463,17 @@ def get_salary_scoring_config(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     sal_config = config.get('salary_scoring', {})
     
-    return {
-        'ideal_salary_lpa': sal_config.get('ideal_salary_lpa', 8.0),
-        'min_acceptable_lpa': sal_config.get('min_acceptable_lpa', 3.0),
-        'max_expected_lpa': sal_config.get('max_expected_lpa', 15.0),
-        'below_min_penalty': sal_config.get('below_min_penalty', 0.5),
-        'above_max_bonus': sal_config.get('above_max_bonus', 0.2),
-        'missing_salary_score': sal_config.get('missing_salary_score', 0.5)
-    }
+    return SalaryScoringConfig(
+        ideal_salary_lpa=sal_config.get('ideal_salary_lpa', 8.0),
+        min_acceptable_lpa=sal_config.get('min_acceptable_lpa', 3.0),
+        max_expected_lpa=sal_config.get('max_expected_lpa', 15.0),
+        below_min_penalty=sal_config.get('below_min_penalty', 0.5),
+        above_max_bonus=sal_config.get('above_max_bonus', 0.2),
+        missing_salary_score=sal_config.get('missing_salary_score', 0.5)
+    )
 
 
-def get_deadline_urgency_config(config: Dict[str, Any]) -> Dict[str, Any]:
+def get_deadline_urgency_config(config: Dict[str, Any]) -> DeadlineUrgencyConfig:
     """
     Get deadline urgency configuration.
     
@@ -258,14 +485,14 @@ def get_deadline_urgency_config(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     deadline_config = config.get('deadline_urgency', {})
     
-    return {
-        'days_thresholds': deadline_config.get('days_thresholds', {}),
-        'urgency_scores': deadline_config.get('urgency_scores', {}),
-        'expired_penalty': deadline_config.get('expired_penalty', 0.0)
-    }
+    return DeadlineUrgencyConfig(
+        days_thresholds=deadline_config.get('days_thresholds', {}),
+        urgency_scores=deadline_config.get('urgency_scores', {}),
+        expired_penalty=deadline_config.get('expired_penalty', 0.0)
+    )
 
 
-def get_logging_config(config: Dict[str, Any]) -> Dict[str, Any]:
+def get_logging_config(config: Dict[str, Any]) -> LoggingConfig:
     """
     Get logging configuration.
     
@@ -277,11 +504,59 @@ def get_logging_config(config: Dict[str, Any]) -> Dict[str, Any]:
     """
     log_config = config.get('logging', {})
     
-    return {
-        'level': log_config.get('level', 'INFO'),
-        'file': log_config.get('file', 'job_prioritization.log'),
-        'enable_performance_metrics': log_config.get('enable_performance_metrics', True)
-    }
+    return LoggingConfig(
+        level=log_config.get('level', 'INFO'),
+        file=log_config.get('file', 'job_prioritization.log'),
+        enable_performance_metrics=log_config.get('enable_performance_metrics', True)
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class Phase4Config:
+    """
+    All Phase 4 settings, built from a loaded config in one pass.
+    
+    Fields hold the same values the individual get_*/create_* helpers
+    return, so callers can hold one object instead of calling each helper.
+    """
+    user_profile: Dict[str, Any]
+    weights: Dict[str, Any]
+    paths: InputOutputPaths
+    incremental: IncrementalProcessingConfig
+    company_reputation: CompanyReputationConfig
+    skills_scoring: SkillsScoringConfig
+    location_scoring: LocationScoringConfig
+    salary_scoring: SalaryScoringConfig
+    deadline_urgency: DeadlineUrgencyConfig
+    logging: LoggingConfig
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'Phase4Config':
+        return cls(
+            user_profile=create_user_profile_from_config(config),
+            weights=create_weights_from_config(config),
+            paths=get_input_output_paths(config),
+            incremental=get_incremental_processing_config(config),
+            company_reputation=get_company_reputation_config(config),
+            skills_scoring=get_skills_scoring_config(config),
+            location_scoring=get_location_scoring_config(config),
+            salary_scoring=get_salary_scoring_config(config),
+            deadline_urgency=get_deadline_urgency_config(config),
+            logging=get_logging_config(config)
+        )
+
+
+def load_phase4_config(config_path: str = "config.json") -> Phase4Config:
+    """
+    Load config.json and build every Phase 4 setting at once.
+    
+    Args:
+        config_path: Path to config.json file
+        
+    Returns:
+        Phase4Config instance
+    """
+    return Phase4Config.from_config(load_config(config_path))
 
 
 # Example usage
@@ -1,16 +1,36 @@
 #!/usr/bin/env python3
 """
 Placement Mail Analysis System - Pipeline Orchestrator
-Runs all 6 phases sequentially with error handling and progress tracking.
+Runs all phases with error handling and progress tracking, overlapping
+phases that do not depend on each other.
 """
 
 import os
 import sys
+import json
+import shutil
+import hashlib
+import tempfile
+import threading
+import importlib.util
 import subprocess
 import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+# Execute notebooks in-process when nbclient is installed, avoiding a
+# jupyter/nbconvert interpreter start per phase
+try:
+    import nbformat
+    from nbclient import NotebookClient
+    from nbclient.exceptions import CellExecutionError
+    from jupyter_client import KernelManager
+    NBCLIENT_AVAILABLE = True
+except ImportError:
+    NBCLIENT_AVAILABLE = False
+
 # Setup logging
 log_dir = Path("logs")
 log_dir.mkdir(exist_ok=True)
@@ -27,92 +47,417 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Phase definitions
+# Phase definitions; "depends_on" lists the (1-based) phase numbers whose
+# outputs a phase reads, so independent phases can run concurrently.
+# "inputs" lists the files a phase reads; only phases that declare them are
+# cached, since the others pull from Gmail or scan for files. Phases marked
+# "side_outputs" also write files besides "output" (incremental state, extra
+# reports), so restoring the cached output alone can't replace a run and
+# they are never cached.
 PHASES = [
     {
         "name": "Phase 1: Email Extraction",
         "notebook": "phases/Phase 1/data_extracting.ipynb",
         "output": "phases/Phase 1/placement_emails.csv",
-        "description": "Extract emails from Gmail API"
+        "description": "Extract emails from Gmail API",
+        "depends_on": []
     },
     {
         "name": "Phase 2: Data Cleaning",
         "notebook": "phases/Phase 2/data_cleaning.ipynb",
         "output": "phases/Phase 2/ai_cleaned_emails.csv",
-        "description": "Clean email content with AI"
+        "description": "Clean email content with AI",
+        "depends_on": [1],
+        "inputs": ["phases/Phase 1/placement_emails.csv"],
+        "side_outputs": True
     },
     {
         "name": "Phase 2: Data Filtering",
         "notebook": "phases/Phase 2/data_filtering.ipynb",
         "output": "phases/Phase 2/relevant_placement_emails.csv",
-        "description": "Filter relevant placement emails"
+        "description": "Filter relevant placement emails",
+        "depends_on": [2],
+        "inputs": ["phases/Phase 2/ai_cleaned_emails.csv"]
     },
     {
         "name": "Phase 3: Entity Structuring",
         "notebook": "phases/Phase 3/entity_structuring.ipynb",
         "output": "phases/Phase 3/structured_job_postings.json",
-        "description": "Extract structured job information"
+        "description": "Extract structured job information",
+        "depends_on": [3],
+        "inputs": ["phases/Phase 2/relevant_placement_emails.csv"],
+        "side_outputs": True
     },
     {
         "name": "Phase 4: Job Prioritization",
         "notebook": "phases/Phase 4/job_prioritization.ipynb",
         "output": "phases/Phase 4/prioritized_jobs.csv",
-        "description": "Rank and prioritize job opportunities"
+        "description": "Rank and prioritize job opportunities",
+        "depends_on": [4],
+        "inputs": ["phases/Phase 3/structured_job_postings.json"],
+        "side_outputs": True
     },
     {
         "name": "Phase 5: PDF Management",
         "notebook": "phases/Phase 5/PDF_Management.ipynb",
         "output": "phases/Phase 5/pdf_metadata.json",
-        "description": "Process and index PDF documents"
+        "description": "Process and index PDF documents",
+        "depends_on": [1]
     },
     {
         "name": "Phase 5: RAG System",
         "notebook": "phases/Phase 5/RAG_System.ipynb",
         "output": "phases/Phase 5/vector_db",
-        "description": "Build vector database for Q&A"
+        "description": "Build vector database for Q&A",
+        "depends_on": [5],
+        "inputs": ["phases/Phase 4/prioritized_jobs.csv"]
     },
     {
         "name": "Phase 6: Excel Reports",
         "notebook": "phases/Phase 6/Excel_Integrate.ipynb",
         "output": "phases/Phase 6/excel_reports",
-        "description": "Generate formatted Excel reports"
+        "description": "Generate formatted Excel reports",
+        "depends_on": [5],
+        "inputs": ["phases/Phase 4/prioritized_jobs.csv"],
+        "side_outputs": True
     }
 ]
 
 
-def check_prerequisites():
-    """Check if required tools and files exist."""
-    logger.info("Checking prerequisites...")
+# Each phase runs its own kernel, so keep concurrency modest
+MAX_PARALLEL_PHASES = min(os.cpu_count() or 1, 4)
+
+# nbconvert fallback command; the notebook path is appended per phase
+NBCONVERT_CMD = (
+    "jupyter", "nbconvert",
+    "--to", "notebook",
+    "--execute",
+    "--inplace",
+    "--ExecutePreprocessor.timeout=600",
+)
+
+# Outputs of previous runs, keyed by a hash of each phase's code and inputs
+CACHE_DIR = Path(".cache")
+CACHE_KEEP = 20
+
+
+def phase_cache_key(phase: dict):
+    """
+    Hash a phase's notebook code, helper modules, input files and config.
     
-    # Check Python version
-    if sys.version_info < (3, 12):
-        logger.error(f"Python 3.12+ required, found {sys.version}")
+    Only cell sources are hashed, because nbconvert rewrites the notebook's
+    outputs on every run. Modules next to the notebook (config loaders,
+    state helpers) are hashed whole, and inputs are fingerprinted by size
+    and mtime.
+    
+    Returns:
+        Hex digest, or None if the phase is not cacheable
+    """
+    if not phase.get("inputs") or phase.get("side_outputs"):
+        return None
+    
+    digest = hashlib.sha256()
+    phase_dir = Path(phase["notebook"]).parent
+    try:
+        with open(phase["notebook"], "r", encoding="utf-8") as f:
+            notebook = json.load(f)
+        for cell in notebook.get("cells", []):
+            digest.update(cell.get("cell_type", "").encode())
+            digest.update("".join(cell.get("source", [])).encode("utf-8"))
+        
+        for module_path in sorted(phase_dir.glob("*.py")):
+            digest.update(module_path.name.encode("utf-8"))
+            digest.update(module_path.read_bytes())
+        
+        for input_path in phase["inputs"]:
+            st = os.stat(input_path)
+            digest.update(f"{input_path}:{st.st_size}:{st.st_mtime_ns}".encode())
+        
+        config_path = phase_dir / "config.json"
+        if config_path.exists():
+            digest.update(config_path.read_bytes())
+    except (OSError, ValueError):
+        # Missing input or unreadable notebook: just run the phase
+        return None
+    
+    return digest.hexdigest()
+
+
+def restore_cached_output(key: str, output_path: str) -> bool:
+    """
+    Replace a phase's output with its cached copy. Returns True on a cache hit.
+    
+    The copy is staged next to the output and swapped in with renames, so a
+    failed copy leaves the existing output untouched and a directory output
+    never mixes files from different runs.
+    """
+    cached = CACHE_DIR / key / Path(output_path).name
+    if not cached.exists():
         return False
     
-    # Check jupyter
+    target = Path(output_path)
     try:
-        result = subprocess.run(
-            ["jupyter", "--version"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        logger.info(f"Jupyter found: {result.stdout.strip()}")
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{target.name}.", dir=target.parent))
+    except OSError as e:
+        logger.warning(f"Could not restore cached output {cached}: {e}")
+        return False
+    
+    staged = staging / target.name
+    old = staging / f"{target.name}.old"
+    try:
+        if cached.is_dir():
+            shutil.copytree(cached, staged)
+        else:
+            shutil.copy2(cached, staged)
+        # A non-empty directory can't be renamed over, so move it aside first
+        if target.is_dir():
+            os.replace(target, old)
+        try:
+            os.replace(staged, target)
+        except OSError:
+            if old.exists():
+                os.replace(old, target)
+            raise
+        # Mark as recently used for pruning
+        os.utime(CACHE_DIR / key)
+        return True
+    except OSError as e:
+        logger.warning(f"Could not restore cached output {cached}: {e}")
+        return False
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def store_cached_output(key: str, output_path: str) -> None:
+    """Save a phase's output under its cache key."""
+    source = Path(output_path)
+    if not source.exists():
+        return
+    
+    entry = CACHE_DIR / key
+    try:
+        entry.mkdir(parents=True, exist_ok=True)
+        if source.is_dir():
+            shutil.copytree(source, entry / source.name, dirs_exist_ok=True)
+        else:
+            shutil.copy2(source, entry / source.name)
+    except OSError as e:
+        logger.warning(f"Could not cache output {output_path}: {e}")
+        shutil.rmtree(entry, ignore_errors=True)
+
+
+def prune_cache(keep: int = CACHE_KEEP) -> None:
+    """Remove all but the most recently used cache entries."""
+    if not CACHE_DIR.is_dir():
+        return
+    
+    entries = sorted(
+        (entry for entry in CACHE_DIR.iterdir() if entry.is_dir()),
+        key=lambda entry: entry.stat().st_mtime,
+        reverse=True
+    )
+    for entry in entries[keep:]:
+        shutil.rmtree(entry, ignore_errors=True)
+
+
+def _check_jupyter() -> bool:
+    """Check jupyter is importable without spawning the CLI."""
+    if importlib.util.find_spec("jupyter_core") is None:
         logger.error("Jupyter not found. Install with: pip install jupyter")
         return False
+    from jupyter_core.version import __version__ as jupyter_version
+    logger.info(f"Jupyter found: jupyter_core {jupyter_version}")
     
-    # Check if Phase 1 has credentials
+    # Without nbclient, notebooks run through the jupyter nbconvert CLI
+    if not NBCLIENT_AVAILABLE and (
+        shutil.which(NBCONVERT_CMD[0]) is None
+        or importlib.util.find_spec("nbconvert") is None
+    ):
+        logger.error("jupyter nbconvert not found. Install with: pip install nbconvert")
+        return False
+    return True
+
+
+def _check_credentials() -> bool:
+    """Warn if Phase 1 has no Gmail credentials (not fatal)."""
     creds_file = Path("phases/Phase 1/credentials.json")
     if not creds_file.exists():
         logger.warning(f"Gmail credentials not found at {creds_file}")
         logger.warning("Phase 1 will require manual authentication")
-    
     return True
 
 
-def run_notebook(notebook_path: str, phase_name: str) -> bool:
-    """Execute a Jupyter notebook using nbconvert."""
+def check_prerequisites():
+    """Check if required tools and files exist."""
+    logger.info("Checking prerequisites...")
+    
+    # Check Python version
+    if sys.version_info < (3, 12):
+        logger.error(f"Python 3.12+ required, found {sys.version}")
+        return False
+    
+    return _check_jupyter() and _check_credentials()
+
+
+class KernelPool:
+    """
+    Pre-started kernels with common libraries already imported.
+    
+    Notebooks lease a warm kernel instead of paying kernel startup and
+    heavy imports per phase. Kernels are started in their notebook's
+    directory, as nbconvert does, and only lent to notebooks from that
+    directory. Between notebooks user variables and logging handlers are
+    cleared, but imported modules, os.environ and sys.path carry over, so
+    notebooks sharing a kernel must not depend on a pristine interpreter.
+    A kernel whose notebook fails is restarted, or dropped if that fails.
+    """
+    
+    PREAMBLE = (
+        "import os, json, logging\n"
+        "try:\n"
+        "    import numpy, pandas\n"
+        "    from google import genai\n"
+        "except ImportError:\n"
+        "    pass\n"
+    )
+    
+    # Clear user variables and logging handlers, so each notebook's
+    # logging.basicConfig() still takes effect
+    RESET = (
+        "%reset -f\n"
+        "import logging\n"
+        "for handler in logging.root.handlers[:]:\n"
+        "    logging.root.removeHandler(handler)\n"
+        "    handler.close()\n"
+    )
+    
+    def __init__(self, directories, kernel_name: str = "python3"):
+        """Start one kernel in each of the given working directories."""
+        self.kernel_name = kernel_name
+        self._lock = threading.Lock()
+        self._idle = {}
+        self._managers = []
+        try:
+            for cwd in directories:
+                km = self._start(cwd)
+                self._idle.setdefault(cwd, []).append(km)
+        except Exception:
+            self.shutdown()
+            raise
+    
+    def _start(self, cwd: str):
+        km = KernelManager(kernel_name=self.kernel_name)
+        km.start_kernel(cwd=cwd)
+        with self._lock:
+            self._managers.append(km)
+        try:
+            self._run(km, self.PREAMBLE)
+        except Exception:
+            self._discard(km)
+            raise
+        return km
+    
+    def _discard(self, km) -> None:
+        with self._lock:
+            if km in self._managers:
+                self._managers.remove(km)
+        try:
+            km.shutdown_kernel(now=True)
+        except Exception:
+            pass
+    
+    @staticmethod
+    def _run(km, code: str) -> None:
+        kc = km.client()
+        kc.start_channels()
+        try:
+            kc.wait_for_ready(timeout=60)
+            kc.execute_interactive(code, timeout=300, store_history=False)
+        finally:
+            kc.stop_channels()
+    
+    @contextmanager
+    def lease(self, cwd: str):
+        """Borrow a kernel running in cwd, starting one if none is idle."""
+        with self._lock:
+            idle = self._idle.setdefault(cwd, [])
+            km = idle.pop() if idle else None
+        if km is None:
+            km = self._start(cwd)
+        
+        clean = False
+        try:
+            yield km
+            clean = True
+        finally:
+            try:
+                if clean:
+                    self._run(km, self.RESET + self.PREAMBLE)
+                else:
+                    km.restart_kernel(now=True)
+                    self._run(km, self.PREAMBLE)
+            except Exception as e:
+                logger.warning(f"Dropping pooled kernel that could not be reset: {e}")
+                self._discard(km)
+            else:
+                with self._lock:
+                    self._idle.setdefault(cwd, []).append(km)
+    
+    def shutdown(self) -> None:
+        with self._lock:
+            managers, self._managers = self._managers, []
+            self._idle.clear()
+        for km in managers:
+            try:
+                km.shutdown_kernel(now=True)
+            except Exception:
+                pass
+
+
+def start_kernel_pool(directories):
+    """Start a KernelPool, or return None to use a fresh kernel per notebook."""
+    if not NBCLIENT_AVAILABLE or not directories:
+        return None
+    try:
+        logger.info(f"Starting {len(directories)} pre-warmed kernel(s)...")
+        return KernelPool(directories)
+    except Exception as e:
+        logger.warning(f"Kernel pool unavailable, using one kernel per notebook: {e}")
+        return None
+
+
+def execute_notebook(notebook_path: str, kernel_pool: KernelPool = None) -> None:
+    """
+    Execute a notebook in place with nbclient.
+    
+    Cells run with the notebook's directory as working directory, as with
+    nbconvert. Raises CellExecutionError if a cell fails.
+    """
+    nb = nbformat.read(notebook_path, as_version=4)
+    notebook_dir = str(Path(notebook_path).parent.resolve())
+    
+    if kernel_pool is None:
+        client = NotebookClient(
+            nb,
+            timeout=600,
+            kernel_name="python3",
+            resources={"metadata": {"path": notebook_dir}}
+        )
+        client.execute()
+    else:
+        with kernel_pool.lease(notebook_dir) as km:
+            NotebookClient(nb, timeout=600, km=km).execute()
+    
+    nbformat.write(nb, notebook_path)
+
+
+def run_notebook(
+    notebook_path: str,
+    phase_name: str,
+    kernel_pool: KernelPool = None
+) -> bool:
+    """Execute a Jupyter notebook with nbclient, or nbconvert as a fallback."""
     logger.info(f"Starting: {phase_name}")
     logger.info(f"Notebook: {notebook_path}")
     
@@ -121,22 +466,17 @@ def run_notebook(notebook_path: str, phase_name: str) -> bool:
         return False
     
     try:
-        # Run notebook with nbconvert
-        cmd = [
-            "jupyter", "nbconvert",
-            "--to", "notebook",
-            "--execute",
-            "--inplace",
-            "--ExecutePreprocessor.timeout=600",
-            notebook_path
-        ]
-        
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        if NBCLIENT_AVAILABLE:
+            execute_notebook(notebook_path, kernel_pool)
+        else:
+            # Run notebook with nbconvert; only stderr is kept for errors
+            subprocess.run(
+                NBCONVERT_CMD + (notebook_path,),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=True
+            )
         
         logger.info(f"[OK] Completed: {phase_name}")
         return True
@@ -146,10 +486,28 @@ def run_notebook(notebook_path: str, phase_name: str) -> bool:
         logger.error(f"Error: {e.stderr}")
         return False
     except Exception as e:
+        if NBCLIENT_AVAILABLE and isinstance(e, CellExecutionError):
+            logger.error(f"[FAILED] {phase_name}")
+            logger.error(f"Error: {e}")
+            return False
         logger.error(f"[FAILED] Unexpected error in {phase_name}: {e}")
         return False
 
 
+def _directory_size(path: str) -> int:
+    """Sum file sizes under a directory in a single os.scandir walk."""
+    total = 0
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
+
+
 def verify_output(output_path: str) -> bool:
     """Check if expected output file/folder exists."""
     path = Path(output_path)
@@ -160,14 +518,109 @@ def verify_output(output_path: str) -> bool:
             size = path.stat().st_size
             logger.info(f"  Output verified: {output_path} ({size:,} bytes)")
         else:
-            logger.info(f"  Output verified: {output_path} (directory)")
+            size = _directory_size(output_path)
+            logger.info(f"  Output verified: {output_path} (directory, {size:,} bytes)")
     else:
         logger.warning(f"  Output not found: {output_path}")
     
     return exists
 
 
-def run_pipeline(start_phase: int = 1, end_phase: int = None):
+def run_phase(
+    phase_number: int,
+    use_cache: bool = True,
+    kernel_pool: KernelPool = None
+) -> bool:
+    """Run one phase by number and verify its output."""
+    phase = PHASES[phase_number - 1]
+    logger.info(f"\n{'='*70}")
+    logger.info(f"PHASE {phase_number}/{len(PHASES)}: {phase['name']}")
+    logger.info(f"{'='*70}")
+    logger.info(f"Description: {phase['description']}")
+    
+    # Skip execution when code and inputs match a previous run
+    cache_key = phase_cache_key(phase) if use_cache else None
+    if cache_key and restore_cached_output(cache_key, phase['output']):
+        logger.info(f"[CACHED] {phase['name']}: inputs unchanged, output restored")
+        verify_output(phase['output'])
+        return True
+    
+    # Run the notebook
+    success = run_notebook(phase['notebook'], phase['name'], kernel_pool)
+    
+    if success:
+        # Verify output
+        if verify_output(phase['output']) and cache_key:
+            store_cached_output(cache_key, phase['output'])
+    else:
+        logger.error(f"\nPhase {phase_number} failed. Check logs for details.")
+    
+    return success
+
+
+def run_phases_parallel(
+    phase_numbers,
+    max_workers: int = None,
+    use_cache: bool = True,
+    kernel_pool: KernelPool = None
+):
+    """
+    Run phases as a DAG, starting each one as soon as its dependencies
+    have succeeded.
+    
+    Dependencies outside phase_numbers are assumed to have run already.
+    Phases downstream of a failure are skipped.
+    
+    Returns:
+        (completed, failed, skipped) phase-number lists
+    """
+    if max_workers is None:
+        max_workers = MAX_PARALLEL_PHASES
+    
+    selected = set(phase_numbers)
+    waiting = {
+        n: set(PHASES[n - 1].get("depends_on", [])) & selected
+        for n in sorted(selected)
+    }
+    completed, failed, skipped = [], [], []
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = {}
+        
+        def schedule():
+            for n in [n for n, deps in waiting.items() if deps <= set(completed)]:
+                del waiting[n]
+                running[executor.submit(run_phase, n, use_cache, kernel_pool)] = n
+        
+        schedule()
+        while running:
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                n = running.pop(future)
+                (completed if future.result() else failed).append(n)
+            
+            # Phases are numbered after their dependencies, so one ordered
+            # pass propagates skips down the whole chain
+            for n in sorted(waiting):
+                if waiting[n] & (set(failed) | set(skipped)):
+                    del waiting[n]
+                    skipped.append(n)
+                    logger.warning(
+                        f"Skipping {PHASES[n - 1]['name']}: "
+                        "a phase it depends on did not complete"
+                    )
+            
+            schedule()
+    
+    return completed, failed, skipped
+
+
+def run_pipeline(
+    start_phase: int = 1,
+    end_phase: int = None,
+    serial: bool = False,
+    use_cache: bool = True
+):
     """Run the complete pipeline or specific phases."""
     if not check_prerequisites():
         logger.error("Prerequisites check failed. Aborting.")
@@ -183,43 +636,57 @@ def run_pipeline(start_phase: int = 1, end_phase: int = None):
     logger.info(f"Log file: {log_file}")
     logger.info("")
     
-    phases_to_run = PHASES[start_phase-1:end_phase]
+    if use_cache:
+        prune_cache()
+    
+    phase_numbers = list(range(start_phase, end_phase + 1))
     completed = 0
     failed = 0
+    skipped = 0
     
-    for i, phase in enumerate(phases_to_run, start=start_phase):
-        logger.info(f"\n{'='*70}")
-        logger.info(f"PHASE {i}/{len(PHASES)}: {phase['name']}")
-        logger.info(f"{'='*70}")
-        logger.info(f"Description: {phase['description']}")
-        
-        # Run the notebook
-        success = run_notebook(phase['notebook'], phase['name'])
-        
-        if success:
-            # Verify output
-            verify_output(phase['output'])
-            completed += 1
+    # Pre-warm kernels for as many phase directories as can run at once;
+    # the rest are started when their first notebook runs
+    directories = list(dict.fromkeys(
+        str(Path(PHASES[i - 1]["notebook"]).parent.resolve()) for i in phase_numbers
+    ))
+    kernel_pool = start_kernel_pool(
+        directories[:1 if serial else MAX_PARALLEL_PHASES]
+    )
+    
+    try:
+        if serial:
+            for i in phase_numbers:
+                if run_phase(i, use_cache, kernel_pool):
+                    completed += 1
+                else:
+                    failed += 1
+                    
+                    # Ask if user wants to continue
+                    response = input("\nContinue to next phase? (y/n): ").strip().lower()
+                    if response != 'y':
+                        logger.info("Pipeline execution stopped by user.")
+                        break
         else:
-            failed += 1
-            logger.error(f"\nPhase {i} failed. Check logs for details.")
-            
-            # Ask if user wants to continue
-            response = input("\nContinue to next phase? (y/n): ").strip().lower()
-            if response != 'y':
-                logger.info("Pipeline execution stopped by user.")
-                break
+            done, errors, blocked = run_phases_parallel(
+                phase_numbers, use_cache=use_cache, kernel_pool=kernel_pool
+            )
+            completed, failed, skipped = len(done), len(errors), len(blocked)
+    finally:
+        if kernel_pool is not None:
+            kernel_pool.shutdown()
     
     # Summary
     logger.info(f"\n{'='*70}")
     logger.info("PIPELINE EXECUTION SUMMARY")
     logger.info(f"{'='*70}")
-    logger.info(f"Completed: {completed}/{len(phases_to_run)}")
-    logger.info(f"Failed: {failed}/{len(phases_to_run)}")
+    logger.info(f"Completed: {completed}/{len(phase_numbers)}")
+    logger.info(f"Failed: {failed}/{len(phase_numbers)}")
+    if skipped:
+        logger.info(f"Skipped: {skipped}/{len(phase_numbers)}")
     logger.info(f"Log file: {log_file}")
     logger.info(f"{'='*70}\n")
     
-    return failed == 0
+    return failed == 0 and skipped == 0
 
 
 if __name__ == "__main__":
@@ -240,6 +707,16 @@ if __name__ == "__main__":
         default=None,
         help="Ending phase number (1-8)"
     )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run phases one at a time instead of in parallel"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-run every phase even if its inputs are unchanged"
+    )
     parser.add_argument(
         "--list",
         action="store_true",
@@ -259,5 +736,7 @@ if __name__ == "__main__":
             print()
         sys.exit(0)
     
-    success = run_pipeline(args.start, args.end)
+    success = run_pipeline(
+        args.start, args.end, serial=args.serial, use_cache=not args.no_cache
+    )
     sys.exit(0 if success else 1)
@@ -5,6 +5,12 @@ Start the web interface for the Job Search Assistant.
 
 import os
 import sys
+import importlib.util
+
+
+def _server_impl(name: str) -> str:
+    """Use the C-accelerated uvicorn backend if installed, else let uvicorn choose."""
+    return name if importlib.util.find_spec(name) else "auto"
 
 
 def main():
@@ -36,6 +42,10 @@ def main():
     print("=" * 60)
     print()
 
+    # Extra worker processes share the port; each loads its own copy of the
+    # jobs data and caches conversation context per process
+    workers = int(os.getenv("WEB_WORKERS", "1"))
+
     # Start the server
     import uvicorn
     uvicorn.run(
@@ -43,6 +53,10 @@ def main():
         host="0.0.0.0",
         port=8000,
         reload=False,
+        workers=workers,
+        loop=_server_impl("uvloop"),
+        http=_server_impl("httptools"),
+        server_header=False,
         log_level="info"
     )
 
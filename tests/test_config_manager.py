@@ -0,0 +1,72 @@
+"""Tests for the Phase 3 configuration manager."""
+
+import copy
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "phases", "Phase 3"))
+
+from config_manager import ConfigurationManager, _DEFAULT_CONFIG  # noqa: E402
+
+
+def _manager(fused: bool) -> ConfigurationManager:
+    manager = ConfigurationManager()
+    manager.config = copy.deepcopy(_DEFAULT_CONFIG)
+    manager._build_keyword_sets()
+    manager._compile_matchers()
+    if not fused:
+        manager.compiled["salary_regex"] = None
+    return manager
+
+
+@pytest.mark.parametrize("text", [
+    "CTC: 12 LPA",
+    "package: 5 to 10 lakhs, 12 LPA",
+    "Stipend 20k per month, 6 LPA on conversion",
+    "Salary 8-10 LPA",
+    "20000 per month",
+    "No salary mentioned",
+    "",
+])
+def test_fused_and_sequential_salary_matching_agree(text):
+    assert _manager(fused=True).match_salary(text) == _manager(fused=False).match_salary(text)
+
+
+def test_salary_patterns_follow_config_order():
+    name, matched, groups, confidence = _manager(fused=True).match_salary(
+        "Stipend 20k per month, 6 LPA on conversion"
+    )
+    assert name == "lpa_single"
+    assert matched == "6 LPA"
+    assert groups == ("6",)
+
+
+def test_salary_patterns_with_numbered_backreferences_are_not_fused():
+    manager = ConfigurationManager()
+    manager.config = copy.deepcopy(_DEFAULT_CONFIG)
+    manager.config["salary_parsing"]["patterns"].insert(1, {
+        "name": "repeated_lpa",
+        "pattern": r"(\d+)\s*or\s*\1\s*lpa",
+        "confidence": 0.5
+    })
+    manager._build_keyword_sets()
+    manager._compile_matchers()
+
+    assert manager.compiled["salary_regex"] is None
+    assert manager.match_salary("7 or 7 LPA") == (
+        "repeated_lpa", "7 or 7 LPA", ("7",), 0.5
+    )
+
+
+def test_get_setting_sees_changes_after_loading(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    manager = ConfigurationManager(str(tmp_path / "config.json"))
+    config = manager.load_config()
+    assert manager.get_setting("processing.max_jobs_per_email") == 5
+
+    config["processing"]["max_jobs_per_email"] = 9
+    assert manager.get_setting("processing.max_jobs_per_email") == 9
+    assert manager.get_setting("processing.missing", "fallback") == "fallback"
@@ -0,0 +1,33 @@
+"""Tests for the web API."""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from web import app as web_app  # noqa: E402
+
+
+def test_jobs_endpoint_serves_csv_with_timestamps(tmp_path, monkeypatch):
+    csv_path = tmp_path / "jobs.csv"
+    csv_path.write_text(
+        "company_name,position_title,location_city,final_priority_score,extraction_timestamp\n"
+        "Acme,Data Analyst,Pune,87.5,2024-11-05T10:15:30.123456\n"
+        "Globex,SDE Intern,Bangalore,72.0,2024-11-06T08:00:00\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    monkeypatch.setenv("JOBS_CSV_PATH", str(csv_path))
+    monkeypatch.setattr(web_app, "agent", web_app.JobSearchAgent())
+
+    response = TestClient(web_app.app).get("/api/jobs")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 2
+    assert body["jobs"][0]["company_name"] == "Acme"
+    assert body["jobs"][0]["extraction_timestamp"] == "2024-11-05T10:15:30.123456"
+    assert body["jobs"][1]["final_priority_score"] == 72.0
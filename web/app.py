@@ -4,16 +4,27 @@ FastAPI backend for the conversational job search agent.
 """
 
 import os
+import re
 import sys
 import json
+import heapq
+import asyncio
+import hashlib
 import logging
-from datetime import datetime
-from typing import Optional, Dict, Any, List
+import sqlite3
+import threading
+import functools
+from collections import OrderedDict, defaultdict, deque
+from contextlib import asynccontextmanager
+from itertools import groupby, islice
+from datetime import datetime, timedelta
+from typing import Optional, AsyncIterator, Deque, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
@@ -26,6 +37,19 @@ load_dotenv()
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# orjson serializes responses several times faster when installed
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    DefaultResponse = JSONResponse
+    
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
 # Google Generative AI
 from google import genai
 from google.genai import types
@@ -38,15 +62,114 @@ logging.basicConfig(
 )
 logger = logging.getLogger("WebAgent")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the agent and warm its Gemini connection before serving."""
+    global agent
+    try:
+        agent = get_agent()
+        logger.info("[OK] Agent initialized successfully")
+    except Exception as e:
+        logger.error(f"Failed to initialize agent: {e}")
+    
+    if agent is not None:
+        # Open the connection now so the first user query doesn't pay for
+        # it, without letting a slow or unreachable API hold up startup
+        try:
+            await asyncio.wait_for(
+                agent.client.aio.models.generate_content(
+                    model=agent.model,
+                    contents="ping",
+                    config=types.GenerateContentConfig(max_output_tokens=1)
+                ),
+                timeout=WARMUP_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"Gemini warm-up timed out after {WARMUP_TIMEOUT}s")
+        except Exception as e:
+            logger.warning(f"Gemini warm-up failed: {e}")
+        
+        persist = asyncio.create_task(agent.conversations.run())
+    
+    yield
+    
+    if agent is not None:
+        # Cancelling runs a final flush of queued messages
+        persist.cancel()
+        await asyncio.gather(persist, return_exceptions=True)
+
+
 # FastAPI app
 app = FastAPI(
     title="Placement Job Search Assistant",
     description="AI-powered job search assistant for placement opportunities",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=DefaultResponse
+)
+
+
+class StreamSafeGZipMiddleware(GZipMiddleware):
+    """GZip responses, except event streams that must reach the client per event."""
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/api/chat/stream":
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Job lists and the chat page compress well; tiny bodies aren't worth it
+app.add_middleware(StreamSafeGZipMiddleware, minimum_size=512)
+
+# Templates, found relative to this file so the app starts from any directory
+templates = Jinja2Templates(
+    directory=os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+)
+
+# Job columns indexed for keyword search
+SEARCH_COLUMNS = ['company_name', 'position_title', 'skills_required',
+                  'location_city', 'job_description']
+
+# Local state written by the web app (conversation history)
+CACHE_DIR = ".cache"
+
+# Low-cardinality columns stored as categoricals to save memory
+CATEGORICAL_COLUMNS = ['company_name', 'location_city']
+
+# Search tokens: runs of lowercase letters and digits
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Most recently active users whose conversation context is kept, and the
+# messages kept per user
+MAX_USER_CONTEXTS = 10_000
+HISTORY_SIZE = 10
+
+# Gemini responses kept per (system prompt, prompt) hash
+RESPONSE_CACHE_SIZE = 1024
+
+# Job data only changes on redeploy, so browsers and proxies may reuse
+# /api/jobs and /api/stats responses briefly
+JOBS_CACHE_HEADERS = {"Cache-Control": "public, max-age=30"}
+
+# Seconds the startup Gemini warm-up call may take before serving anyway
+WARMUP_TIMEOUT = 5.0
+
+# Conversation history database, and how often queued messages are written
+CONVERSATIONS_DB = os.getenv(
+    "CONVERSATIONS_DB", os.path.join(CACHE_DIR, "conversations.db")
 )
+PERSIST_INTERVAL = 0.5
 
-# Templates
-templates = Jinja2Templates(directory="web/templates")
+# Stored messages older than this are deleted, checked every PRUNE_INTERVAL
+# seconds; only the last HISTORY_SIZE messages per user are kept either way
+CONVERSATION_RETENTION_DAYS = int(os.getenv("CONVERSATION_RETENTION_DAYS", "30"))
+PRUNE_INTERVAL = 3600
+
+# User id for clients that don't send one. Such requests can come from
+# anyone, so their shared history is never written to disk.
+DEFAULT_USER_ID = "default_user"
 
 
 # ============================================================
@@ -55,7 +178,7 @@ templates = Jinja2Templates(directory="web/templates")
 
 class ChatMessage(BaseModel):
     message: str
-    user_id: str = "default_user"
+    user_id: str = DEFAULT_USER_ID
 
 class ChatResponse(BaseModel):
     status: str
@@ -81,24 +204,132 @@ class QueryIntent(Enum):
 @dataclass
 class UserContext:
     user_id: str
-    conversation_history: List[Dict[str, str]] = field(default_factory=list)
+    # Only the last HISTORY_SIZE messages are kept; older ones drop off on append
+    conversation_history: Deque[Dict[str, str]] = field(
+        default_factory=lambda: deque(maxlen=HISTORY_SIZE)
+    )
     
-    def add_message(self, role: str, content: str):
-        self.conversation_history.append({
+    def add_message(self, role: str, content: str) -> Dict[str, str]:
+        message = {
             'role': role,
             'content': content,
             'timestamp': datetime.now().isoformat()
-        })
-        if len(self.conversation_history) > 10:
-            self.conversation_history = self.conversation_history[-10:]
+        }
+        self.conversation_history.append(message)
+        return message
     
     def get_context(self) -> str:
+        history = self.conversation_history
         return "\n".join([
             f"{m['role'].title()}: {m['content']}" 
-            for m in self.conversation_history[-5:]
+            for m in islice(history, max(len(history) - 5, 0), None)
         ])
 
 
+# ============================================================
+# CONVERSATION STORE
+# ============================================================
+
+class ConversationStore:
+    """
+    SQLite-backed conversation history so restarts keep user context.
+    
+    Messages are queued in memory and written in batches by a background
+    task, so requests never wait on disk I/O or fsync. The same task prunes
+    expired messages and keeps only each user's most recent history.
+    """
+    
+    def __init__(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS msgs "
+            "(user_id TEXT, role TEXT, content TEXT, ts TEXT)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS msgs_user ON msgs(user_id)")
+        self._db.commit()
+        # Background writes and request-time reads share one connection
+        self._lock = threading.Lock()
+        self._pending: List[tuple] = []
+    
+    def load(self, user_id: str, limit: int) -> List[Dict[str, str]]:
+        """Return a user's last ``limit`` messages, oldest first."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT role, content, ts FROM msgs WHERE user_id = ? "
+                "ORDER BY rowid DESC LIMIT ?",
+                (user_id, limit)
+            ).fetchall()
+        return [
+            {'role': role, 'content': content, 'timestamp': ts}
+            for role, content, ts in reversed(rows)
+        ]
+    
+    def append(self, user_id: str, message: Dict[str, str]):
+        """Queue a message for the next batch write."""
+        self._pending.append(
+            (user_id, message['role'], message['content'], message['timestamp'])
+        )
+    
+    def flush(self):
+        """Write all queued messages in one transaction."""
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        with self._lock:
+            try:
+                self._db.executemany("INSERT INTO msgs VALUES (?, ?, ?, ?)", batch)
+                self._db.commit()
+            except sqlite3.Error:
+                # Keep the messages for the next flush, ahead of newer ones
+                self._db.rollback()
+                self._pending[:0] = batch
+                raise
+    
+    def prune(self, max_age_days: int, keep_per_user: int):
+        """Delete expired messages and all but each user's latest ones."""
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+        with self._lock:
+            self._db.execute("DELETE FROM msgs WHERE ts < ?", (cutoff,))
+            self._db.execute(
+                "DELETE FROM msgs WHERE rowid IN ("
+                " SELECT rowid FROM ("
+                "  SELECT rowid, ROW_NUMBER() OVER ("
+                "   PARTITION BY user_id ORDER BY rowid DESC) AS n"
+                "  FROM msgs)"
+                " WHERE n > ?)",
+                (keep_per_user,)
+            )
+            self._db.commit()
+    
+    async def run(self, interval: float = PERSIST_INTERVAL):
+        """
+        Flush queued messages every ``interval`` seconds until cancelled,
+        pruning old history at startup and every PRUNE_INTERVAL seconds.
+        """
+        loop = asyncio.get_running_loop()
+        next_prune = loop.time()
+        try:
+            while True:
+                try:
+                    if loop.time() >= next_prune:
+                        next_prune = loop.time() + PRUNE_INTERVAL
+                        await asyncio.to_thread(
+                            self.prune, CONVERSATION_RETENTION_DAYS, HISTORY_SIZE
+                        )
+                    await asyncio.sleep(interval)
+                    await asyncio.to_thread(self.flush)
+                except sqlite3.Error as e:
+                    logger.error(f"Failed to persist conversations: {e}")
+        finally:
+            try:
+                self.flush()
+            except sqlite3.Error as e:
+                logger.error(f"Failed to persist conversations on shutdown: {e}")
+            finally:
+                self._db.close()
+
+
 # ============================================================
 # JOB SEARCH AGENT
 # ============================================================
@@ -108,7 +339,11 @@ class JobSearchAgent:
     
     def __init__(self):
         self.logger = logging.getLogger("JobSearchAgent")
-        self.user_contexts: Dict[str, UserContext] = {}
+        self.user_contexts: "OrderedDict[str, UserContext]" = OrderedDict()
+        self._response_cache: "OrderedDict[str, str]" = OrderedDict()
+        # Prompt hash -> Gemini call task shared by identical requests
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.conversations = ConversationStore(CONVERSATIONS_DB)
         
         # Initialize Gemini
         api_key = os.getenv('GEMINI_API_KEY')
@@ -122,6 +357,11 @@ class JobSearchAgent:
         
         # Load jobs data
         self.jobs_df = self._load_jobs()
+        # Plain records plus a token -> row index map serve searches
+        # without touching pandas per query
+        self.jobs: List[Dict[str, Any]] = self.jobs_df.to_dict('records')
+        self.search_index = self._build_search_index(self.jobs)
+        self.job_summaries = [self._summarize_job(job) for job in self.jobs]
         self.logger.info(f"[OK] Loaded {len(self.jobs_df)} jobs")
         
         # System prompt
@@ -140,6 +380,10 @@ When presenting jobs, format them clearly with:
 - Key requirements
 
 Keep responses concise but informative. Use bullet points for lists."""
+        self.generation_config = types.GenerateContentConfig(
+            system_instruction=self.system_prompt,
+            temperature=0.7
+        )
 
     def _load_jobs(self) -> pd.DataFrame:
         """Load jobs from various possible locations."""
@@ -156,12 +400,23 @@ Keep responses concise but informative. Use bullet points for lists."""
         for path in paths:
             if path and os.path.exists(path):
                 self.logger.info(f"Loading jobs from: {path}")
-                return pd.read_csv(path)
+                return self._read_jobs_csv(path)
         
         self.logger.warning("Jobs CSV not found, using sample data")
         # Return sample data for demo purposes
         return self._get_sample_jobs()
     
+    def _read_jobs_csv(self, path: str) -> pd.DataFrame:
+        """Read a jobs CSV, leaving date-like columns as the original strings."""
+        # The pyarrow engine parses ISO timestamps (e.g. extraction_timestamp)
+        # into pd.Timestamp, which the JSON responses can't serialize
+        df = pd.read_csv(path)
+        
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        return df
+    
     def _get_sample_jobs(self) -> pd.DataFrame:
         """Return sample job data for demo when no CSV is available."""
         sample_data = [
@@ -213,85 +468,166 @@ Keep responses concise but informative. Use bullet points for lists."""
         ]
         return pd.DataFrame(sample_data)
     
-    def get_context(self, user_id: str) -> UserContext:
-        if user_id not in self.user_contexts:
-            self.user_contexts[user_id] = UserContext(user_id=user_id)
-        return self.user_contexts[user_id]
+    def _build_search_index(self, jobs: List[Dict[str, Any]]) -> Dict[str, Tuple[int, ...]]:
+        """Map each token in the searchable columns to the sorted rows containing it."""
+        index = defaultdict(set)
+        for idx, job in enumerate(jobs):
+            for col in SEARCH_COLUMNS:
+                value = job.get(col)
+                if value is None or pd.isna(value):
+                    continue
+                for token in TOKEN_PATTERN.findall(str(value).lower()):
+                    index[token].add(idx)
+        return {token: tuple(sorted(rows)) for token, rows in index.items()}
+    
+    @staticmethod
+    def _summarize_job(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the job dict returned by searches, with safe column access."""
+        skills = row.get('skills_required')
+        return {
+            'company': row.get('company_name', 'N/A'),
+            'position': row.get('position_title', 'N/A'),
+            'location': row.get('location_city', 'N/A'),
+            'salary': row.get('salary_max', 'N/A'),
+            'skills': skills[:100] if pd.notna(skills) else 'N/A'
+        }
+    
+    @functools.cached_property
+    def stats(self) -> Dict[str, int]:
+        """Job counts for /api/stats; jobs are only loaded once, so computed once."""
+        df = self.jobs_df
+        return {
+            "total_jobs": len(df),
+            "companies": df['company_name'].nunique() if 'company_name' in df.columns else 0,
+            "locations": df['location_city'].nunique() if 'location_city' in df.columns else 0
+        }
+    
+    async def get_context(self, user_id: str) -> UserContext:
+        context = self.user_contexts.get(user_id)
+        if context is None:
+            # Not in memory: restore the user's history from disk, off the
+            # event loop so other requests keep being served meanwhile
+            history = []
+            if user_id != DEFAULT_USER_ID:
+                history = await asyncio.to_thread(
+                    self.conversations.load, user_id, HISTORY_SIZE
+                )
+            # A concurrent request for the same user may have won the race
+            context = self.user_contexts.get(user_id)
+            if context is None:
+                context = self.user_contexts[user_id] = UserContext(user_id=user_id)
+                context.conversation_history.extend(history)
+                # Evict the least recently active user
+                if len(self.user_contexts) > MAX_USER_CONTEXTS:
+                    self.user_contexts.popitem(last=False)
+                return context
+        
+        self.user_contexts.move_to_end(user_id)
+        return context
+    
+    def add_message(self, context: UserContext, role: str, content: str):
+        """Record a message in the user's context and persist it."""
+        message = context.add_message(role, content)
+        if context.user_id != DEFAULT_USER_ID:
+            self.conversations.append(context.user_id, message)
     
     def search_jobs(self, query: str) -> List[Dict]:
         """Search jobs based on query keywords."""
-        if self.jobs_df.empty:
+        if not self.jobs:
             return []
         
-        query_lower = query.lower()
-        keywords = query_lower.split()
+        # Lazily merge the sorted postings of each query token and stop at
+        # the first 5 distinct rows, in file (priority) order
+        postings = [
+            self.search_index.get(token, ())
+            for token in TOKEN_PATTERN.findall(query.lower())
+        ]
+        rows = (idx for idx, _ in groupby(heapq.merge(*postings)))
+        
+        # Summaries are built once at load time
+        return [self.job_summaries[idx] for idx in islice(rows, 5)]
+    
+    async def _generate(self, prompt: str) -> str:
+        """
+        Generate a response without blocking the event loop.
         
-        # Search across multiple columns
-        search_cols = ['company_name', 'position_title', 'skills_required', 
-                       'location_city', 'job_description']
+        Identical prompts are answered from an LRU cache, and concurrent
+        identical prompts share a single Gemini call.
+        """
+        key = hashlib.sha256(
+            (self.system_prompt + prompt).encode('utf-8')
+        ).hexdigest()
         
-        mask = pd.Series([False] * len(self.jobs_df))
-        for col in search_cols:
-            if col in self.jobs_df.columns:
-                col_str = self.jobs_df[col].fillna('').astype(str).str.lower()
-                for kw in keywords:
-                    mask |= col_str.str.contains(kw, na=False)
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+            return cached
         
-        results = self.jobs_df[mask].head(5)
+        # The call runs in its own task so a disconnecting client doesn't
+        # cancel it for everyone else waiting on the same prompt
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._call_gemini(key, prompt))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_call(key, done))
+        return await asyncio.shield(task)
+    
+    async def _call_gemini(self, key: str, prompt: str) -> str:
+        """Make one Gemini call and cache its text under ``key``."""
+        response = await self.client.aio.models.generate_content(
+            model=self.model,
+            contents=prompt,
+            config=self.generation_config
+        )
+        text = response.text.strip()
         
-        # Convert to list of dicts with safe column access
-        jobs = []
-        for _, row in results.iterrows():
-            job = {
-                'company': row.get('company_name', 'N/A'),
-                'position': row.get('position_title', 'N/A'),
-                'location': row.get('location_city', 'N/A'),
-                'salary': row.get('salary_max', 'N/A'),
-                'skills': row.get('skills_required', 'N/A')[:100] if pd.notna(row.get('skills_required')) else 'N/A'
-            }
-            jobs.append(job)
+        self._response_cache[key] = text
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+        return text
+    
+    def _finish_call(self, key: str, task: asyncio.Task) -> None:
+        """Drop a finished call from the in-flight table."""
+        del self._inflight[key]
+        # Waiters (if any) re-raise errors; don't warn when there are none
+        if not task.cancelled():
+            task.exception()
+    
+    def _build_prompt(self, context: UserContext, query: str, jobs: List[Dict]) -> str:
+        """Build the Gemini prompt from conversation context and matched jobs."""
+        jobs_info = ""
+        if jobs:
+            jobs_info = "\n\nRelevant jobs found:\n"
+            for i, job in enumerate(jobs, 1):
+                jobs_info += f"{i}. {job['company']} - {job['position']}\n"
+                jobs_info += f"   Location: {job['location']}, Salary: {job['salary']}\n"
+                jobs_info += f"   Skills: {job['skills']}\n"
         
-        return jobs
+        return f"""Conversation context:
+{context.get_context()}
+
+User query: "{query}"
+{jobs_info}
+
+Provide a helpful response. If jobs were found, summarize them nicely.
+If no jobs match, suggest broadening the search or ask clarifying questions."""
     
     async def process_query(self, query: str, user_id: str) -> Dict[str, Any]:
         """Process user query and generate response."""
-        context = self.get_context(user_id)
-        context.add_message('user', query)
+        query = _normalize_query(query)
+        context = await self.get_context(user_id)
+        self.add_message(context, 'user', query)
         
         try:
             # Search for relevant jobs
             jobs = self.search_jobs(query)
             
             # Build prompt with context and job data
-            jobs_info = ""
-            if jobs:
-                jobs_info = "\n\nRelevant jobs found:\n"
-                for i, job in enumerate(jobs, 1):
-                    jobs_info += f"{i}. {job['company']} - {job['position']}\n"
-                    jobs_info += f"   Location: {job['location']}, Salary: {job['salary']}\n"
-                    jobs_info += f"   Skills: {job['skills']}\n"
+            prompt = self._build_prompt(context, query, jobs)
             
-            prompt = f"""Conversation context:
-{context.get_context()}
-
-User query: "{query}"
-{jobs_info}
-
-Provide a helpful response. If jobs were found, summarize them nicely.
-If no jobs match, suggest broadening the search or ask clarifying questions."""
-
             # Generate response
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    system_instruction=self.system_prompt,
-                    temperature=0.7
-                )
-            )
-            
-            response_text = response.text.strip()
-            context.add_message('assistant', response_text)
+            response_text = await self._generate(prompt)
+            self.add_message(context, 'assistant', response_text)
             
             return {
                 'status': 'success',
@@ -308,29 +644,91 @@ If no jobs match, suggest broadening the search or ask clarifying questions."""
                 'jobs': [],
                 'timestamp': datetime.now().isoformat()
             }
+    
+    async def stream_query(self, query: str, user_id: str) -> AsyncIterator[str]:
+        """
+        Process user query, yielding server-sent events as Gemini generates.
+        
+        Events carry the matched jobs first, then text deltas, then a final
+        status event.
+        """
+        query = _normalize_query(query)
+        context = await self.get_context(user_id)
+        self.add_message(context, 'user', query)
+        
+        try:
+            jobs = self.search_jobs(query)
+            yield _sse({'jobs': jobs})
+            
+            prompt = self._build_prompt(context, query, jobs)
+            parts = []
+            stream = await self.client.aio.models.generate_content_stream(
+                model=self.model,
+                contents=prompt,
+                config=self.generation_config
+            )
+            async for chunk in stream:
+                if chunk.text:
+                    parts.append(chunk.text)
+                    yield _sse({'delta': chunk.text})
+            
+            self.add_message(context, 'assistant', "".join(parts).strip())
+            yield _sse({'status': 'success', 'timestamp': datetime.now().isoformat()})
+            
+        except Exception as e:
+            self.logger.error(f"Error streaming query: {e}")
+            yield _sse({
+                'status': 'error',
+                'response': f"Sorry, I encountered an error: {str(e)}",
+                'timestamp': datetime.now().isoformat()
+            })
+
+
+def _normalize_query(query: str) -> str:
+    """
+    Collapse whitespace in a user query.
+    
+    Repeats of a common question that differ only in spacing then build the
+    same prompt and are answered from the response cache. Case is kept, as
+    it can matter to the model (e.g. company names).
+    """
+    return " ".join(query.split())
+
+
+def _sse(payload: Dict[str, Any]) -> str:
+    """Format one server-sent event."""
+    return f"data: {_json_dumps(payload)}\n\n"
 
 
 # Initialize agent
 agent = None
 
-@app.on_event("startup")
-async def startup():
-    global agent
-    try:
-        agent = JobSearchAgent()
-        logger.info("[OK] Agent initialized successfully")
-    except Exception as e:
-        logger.error(f"Failed to initialize agent: {e}")
+
+@functools.cache
+def get_agent() -> JobSearchAgent:
+    """Create the agent once per process; later calls reuse it."""
+    return JobSearchAgent()
 
 
 # ============================================================
 # API ROUTES
 # ============================================================
 
+# chat.html uses no template variables, so it is rendered once. Browsers
+# revalidate it by ETag and get a 304 while it is unchanged.
+CHAT_HTML = templates.get_template("chat.html").render().encode('utf-8')
+CHAT_HTML_HEADERS = {
+    "ETag": f'"{hashlib.sha256(CHAT_HTML).hexdigest()[:16]}"',
+    "Cache-Control": "no-cache"
+}
+
+
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """Serve the chat interface."""
-    return templates.TemplateResponse("chat.html", {"request": request})
+    if request.headers.get("if-none-match") == CHAT_HTML_HEADERS["ETag"]:
+        return Response(status_code=304, headers=CHAT_HTML_HEADERS)
+    return HTMLResponse(CHAT_HTML, headers=CHAT_HTML_HEADERS)
 
 
 @app.post("/api/chat", response_model=ChatResponse)
@@ -341,44 +739,73 @@ async def chat(message: ChatMessage):
     
     result = await agent.process_query(message.message, message.user_id)
     
-    return ChatResponse(
-        status=result['status'],
-        response=result['response'],
-        jobs=result.get('jobs'),
-        timestamp=result['timestamp']
+    # The agent builds this dict itself, so skip re-validating it as a
+    # ChatResponse; response_model still documents the schema
+    return DefaultResponse({
+        'status': result['status'],
+        'response': result['response'],
+        'intent': None,
+        'jobs': result.get('jobs'),
+        'timestamp': result['timestamp']
+    })
+
+
+@app.post("/api/chat/stream")
+async def chat_stream(message: ChatMessage):
+    """Stream the chat response as server-sent events."""
+    if not agent:
+        raise HTTPException(status_code=503, detail="Agent not initialized")
+    
+    return StreamingResponse(
+        agent.stream_query(message.message, message.user_id),
+        media_type="text/event-stream"
     )
 
 
 @app.get("/api/jobs")
 async def get_jobs(limit: int = 10):
     """Get top prioritized jobs."""
-    if not agent or agent.jobs_df.empty:
+    if not agent or not agent.jobs:
         return {"jobs": [], "total": 0}
     
-    jobs = agent.jobs_df.head(limit).to_dict('records')
-    return {"jobs": jobs, "total": len(agent.jobs_df)}
+    # Records are built once at load time, in priority order
+    return DefaultResponse(
+        {"jobs": agent.jobs[:limit], "total": len(agent.jobs)},
+        headers=JOBS_CACHE_HEADERS
+    )
 
 
 @app.get("/api/stats")
 async def get_stats():
     """Get job statistics."""
-    if not agent or agent.jobs_df.empty:
+    if not agent:
         return {"total_jobs": 0, "companies": 0, "locations": 0}
     
-    df = agent.jobs_df
-    return {
-        "total_jobs": len(df),
-        "companies": df['company_name'].nunique() if 'company_name' in df.columns else 0,
-        "locations": df['location_city'].nunique() if 'location_city' in df.columns else 0
-    }
+    return DefaultResponse(agent.stats, headers=JOBS_CACHE_HEADERS)
+
+
+# Health check bodies, serialized once
+_HEALTH_READY = b'{"status":"healthy","agent_ready":true}'
+_HEALTH_NOT_READY = b'{"status":"healthy","agent_ready":false}'
 
 
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {"status": "healthy", "agent_ready": agent is not None}
+    return Response(
+        content=_HEALTH_READY if agent is not None else _HEALTH_NOT_READY,
+        media_type="application/json"
+    )
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    from run_web import _server_impl
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop=_server_impl("uvloop"),
+        http=_server_impl("httptools"),
+        server_header=False
+    )